@@ -4,25 +4,152 @@ PDF词汇提取器 - 简化版本
 从PDF中提取英文单词，查询释义和音标，生成词汇表
 """
 
-import re
 import sys
 import argparse
+import atexit
+import shelve
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 from dataclasses import dataclass
+from operator import attrgetter
 from typing import List, Dict, Tuple
 import os
 import time
+import zlib
 
 import pdfplumber
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from reportlab.lib.pagesizes import A4
 from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph
 from reportlab.lib.styles import getSampleStyleSheet
 from reportlab.lib import colors
 
+try:
+    # pypdfium2：基于PDFium的C++解析器，文本提取比pdfplumber快数倍（可选依赖）
+    import pypdfium2 as _pdfium
+except ImportError:
+    _pdfium = None
+
+# ASCII扫描表：大写字母映射为小写，字母/数字/下划线以外的字节映射为空格
+# 使文本只需一次translate+split即可完成分词和小写化（全部在C层执行）。
+# '?'同样保留在token中：编码后的文本中'?'只可能来自非ASCII字符的替换
+# （encode 'replace'），留在token内可使含非ASCII字符的词被isalpha过滤掉，
+# 与正则\b语义下"不匹配"的结果一致
+_ASCII_WORD_TABLE = bytes(
+    b + 32 if 65 <= b <= 90
+    else (b if 97 <= b <= 122 or 48 <= b <= 57 or b in (0x3F, 0x5F) else 32)
+    for b in range(256)
+)
+
+
+def _extract_page_range(args: Tuple[str, int, int]) -> List[str]:
+    """进程池工作函数：提取指定页码区间的文本
+
+    每个工作进程独立打开PDF（页面对象无法跨进程序列化），
+    按连续区间分块以摊薄打开文件的开销。后端选择与
+    iter_page_texts保持一致（优先pypdfium2），确保并行路径
+    与顺序路径输出相同的文本。
+    """
+    pdf_path, start, end = args
+    texts = []
+    if _pdfium is not None:
+        pdf = _pdfium.PdfDocument(pdf_path)
+        try:
+            for i in range(start, end):
+                page = pdf[i]
+                textpage = page.get_textpage()
+                texts.append(textpage.get_text_range() or "")
+                textpage.close()
+                page.close()
+        finally:
+            pdf.close()
+    else:
+        with pdfplumber.open(pdf_path) as pdf:
+            for i in range(start, end):
+                texts.append(pdf.pages[i].extract_text() or "")
+    return texts
+
+
+def _scan_ascii_words(text: str) -> List[str]:
+    """基于字节转换表的ASCII单词扫描器
+
+    等价于 re.findall(r'\\b[a-zA-Z]+\\b', text.lower())，
+    但translate/split均为C实现，无正则引擎开销。
+    数字/下划线/'?'（非ASCII字符的替换符）保留在token中再整体丢弃，
+    以复现\\b对"abc123"、"café"类混合token不匹配的行为。
+    原文中的字面'?'先替换为空格，保证编码后残留的'?'只可能来自
+    非ASCII字符。
+    """
+    data = text.replace('?', ' ').encode('ascii', 'replace')
+    tokens = data.translate(_ASCII_WORD_TABLE).decode('ascii').split()
+    return [word for word in tokens if word.isalpha()]
+
+
+class _BloomFilter:
+    """位数组Bloom过滤器
+
+    以极低内存开销（约1.2字节/词@1%误判率）测试单词是否可能属于
+    已知英语词表；无假阴性，因此过滤掉的词一定不在词表中。
+    """
+
+    def __init__(self, capacity: int, error_rate: float = 0.01):
+        import math
+        self.num_bits = max(8, int(-capacity * math.log(error_rate) / (math.log(2) ** 2)))
+        self.num_hashes = max(1, round(self.num_bits / capacity * math.log(2)))
+        self._bits = bytearray((self.num_bits + 7) // 8)
+
+    def _indexes(self, word: str):
+        # 双重哈希模拟k个独立哈希函数
+        h1 = zlib.crc32(word.encode())
+        h2 = zlib.adler32(word.encode()) | 1
+        for i in range(self.num_hashes):
+            yield (h1 + i * h2) % self.num_bits
+
+    def add(self, word: str):
+        for idx in self._indexes(word):
+            self._bits[idx >> 3] |= 1 << (idx & 7)
+
+    def __contains__(self, word: str) -> bool:
+        return all(self._bits[idx >> 3] & (1 << (idx & 7))
+                   for idx in self._indexes(word))
+
+
+class _TokenBucket:
+    """令牌桶限流器（线程安全）
+
+    以固定速率补充令牌，突发流量最多消耗capacity个令牌，
+    用于将并发查询压在API速率限制之下，避免触发429重试。
+    """
+
+    def __init__(self, rate: float, capacity: float):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._last = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """阻塞直到获得一个令牌"""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity,
+                                   self._tokens + (now - self._last) * self.rate)
+                self._last = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+
 
 @dataclass
 class WordInfo:
     """单词信息数据类"""
+    # __slots__省去每实例的__dict__，大词汇量时显著降低内存占用
+    __slots__ = ('word', 'definition', 'pronunciation')
     word: str
     definition: str
     pronunciation: str
@@ -30,56 +157,192 @@ class WordInfo:
 
 class PDFVocabularyExtractor:
     """PDF词汇提取器主类"""
-    
-    def __init__(self):
-        self.stop_words = {
-            'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for', 'of', 'with', 'by',
-            'is', 'are', 'was', 'were', 'be', 'been', 'being', 'have', 'has', 'had', 'do', 'does', 'did',
-            'will', 'would', 'could', 'should', 'may', 'might', 'can', 'must', 'shall'
-        }
+
+    # 类级frozenset：所有实例共享一份，且哈希探测无需处理可变性
+    stop_words = frozenset({
+        'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for', 'of', 'with', 'by',
+        'is', 'are', 'was', 'were', 'be', 'been', 'being', 'have', 'has', 'had', 'do', 'does', 'did',
+        'will', 'would', 'could', 'should', 'may', 'might', 'can', 'must', 'shall'
+    })
+
+    def __init__(self, max_workers: int = 16, requests_per_second: float = 10.0):
         self.cache = {}
+        self.max_workers = max_workers
+
+        # 限流器：并发线程共享，确保对词典API的总请求速率可控
+        self.rate_limiter = _TokenBucket(rate=requests_per_second,
+                                         capacity=max(1.0, requests_per_second))
+
+        # 持久化缓存：重复处理同一批单词时避免再次访问网络
+        cache_dir = os.path.expanduser('~/.vocabulary_extractor')
+        os.makedirs(cache_dir, exist_ok=True)
+        self.shelf = shelve.open(os.path.join(cache_dir, 'word_cache.db'))
+        self._shelf_lock = threading.Lock()
+        atexit.register(self.shelf.close)
+
+        # 正在进行的查询：并发请求同一单词时合并为一次网络调用
+        self._in_flight: Dict[str, threading.Event] = {}
+        self._in_flight_lock = threading.Lock()
+
+        # 英语词表Bloom过滤器：不在词表中的token直接拒绝，不发起网络请求
+        self.english_filter = self._build_english_filter()
+
+        # 复用连接池，启用HTTP keep-alive以支持并发查询；
+        # 传输层自动重试瞬时故障（连接重置、502/503等），带指数退避
+        self.session = requests.Session()
+        retry = Retry(
+            total=2,
+            backoff_factor=0.3,
+            status_forcelist=(502, 503, 504),
+            allowed_methods=('GET',)
+        )
+        adapter = HTTPAdapter(pool_connections=32, pool_maxsize=32, max_retries=retry)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
     
+    @staticmethod
+    def _build_english_filter():
+        """从系统词表构建Bloom过滤器；词表不存在时返回None（不过滤）"""
+        for path in ('/usr/share/dict/words', '/usr/dict/words'):
+            try:
+                with open(path, encoding='utf-8', errors='ignore') as f:
+                    words = [line.strip().lower() for line in f
+                             if line.strip().isalpha()]
+            except OSError:
+                continue
+            if words:
+                bloom = _BloomFilter(capacity=len(words))
+                for word in words:
+                    bloom.add(word)
+                return bloom
+        return None
+
+    def iter_page_texts(self, pdf_path: str):
+        """逐页产出PDF文本，避免在内存中拼接整个文档
+
+        优先使用pypdfium2（C++解析器），未安装时退回pdfplumber。
+        """
+        if not os.path.exists(pdf_path):
+            raise FileNotFoundError(f"文件不存在: {pdf_path}")
+
+        try:
+            if _pdfium is not None:
+                pdf = _pdfium.PdfDocument(pdf_path)
+                try:
+                    for page in pdf:
+                        textpage = page.get_textpage()
+                        page_text = textpage.get_text_range()
+                        textpage.close()
+                        page.close()
+                        if page_text:
+                            yield page_text
+                finally:
+                    pdf.close()
+            else:
+                with pdfplumber.open(pdf_path) as pdf:
+                    for page in pdf.pages:
+                        page_text = page.extract_text()
+                        if page_text:
+                            yield page_text
+        except FileNotFoundError:
+            raise
+        except Exception as e:
+            raise ValueError(f"无法读取PDF文件: {e}")
+
     def extract_text_from_pdf(self, pdf_path: str) -> str:
         """从PDF提取文本"""
+        return "".join(self.iter_page_texts(pdf_path))
+
+    def extract_text_parallel(self, pdf_path: str, workers: int = None) -> str:
+        """多进程并行提取PDF文本
+
+        PDF解析是CPU密集型操作，按页码区间分块交给进程池处理，
+        适合页数较多的文档；页数少时直接走流式路径。
+        """
         if not os.path.exists(pdf_path):
             raise FileNotFoundError(f"文件不存在: {pdf_path}")
-        
+
+        workers = workers or min(os.cpu_count() or 1, 8)
+
         try:
-            text = ""
             with pdfplumber.open(pdf_path) as pdf:
-                for page in pdf.pages:
-                    text += page.extract_text() or ""
-            return text
+                total_pages = len(pdf.pages)
+        except Exception as e:
+            raise ValueError(f"无法读取PDF文件: {e}")
+
+        # 页数不足以摊薄进程启动开销时退回顺序提取
+        if total_pages < workers * 2:
+            return self.extract_text_from_pdf(pdf_path)
+
+        # 按连续区间分块，保持页面顺序
+        chunk_size = -(-total_pages // workers)
+        ranges = [(pdf_path, start, min(start + chunk_size, total_pages))
+                  for start in range(0, total_pages, chunk_size)]
+
+        try:
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                return "".join(
+                    text
+                    for chunk in executor.map(_extract_page_range, ranges)
+                    for text in chunk
+                )
         except Exception as e:
             raise ValueError(f"无法读取PDF文件: {e}")
     
     def extract_english_words(self, text: str) -> List[str]:
         """提取英文单词"""
-        # 使用正则表达式提取单词
-        words = re.findall(r'\b[a-zA-Z]+\b', text.lower())
-        
-        # 过滤停用词和短词
-        words = [word for word in words if len(word) > 2 and word not in self.stop_words]
-        
-        # 去重并保持顺序
-        seen = set()
-        unique_words = []
-        for word in words:
-            if word not in seen:
-                seen.add(word)
-                unique_words.append(word)
-        
-        return unique_words
+        # 扫描分词（translate表已批量完成小写化）-> 保序去重 -> 过滤
+        # 先去重再过滤：谓词只需对每个唯一单词求值一次，而非每个token
+        stop_words = self.stop_words
+        return [word for word in dict.fromkeys(_scan_ascii_words(text))
+                if len(word) > 2 and word not in stop_words]
     
     def query_word_info(self, word: str) -> Tuple[str, str]:
         """查询单词释义和音标"""
         if word in self.cache:
             return self.cache[word]
-        
+
+        # Bloom过滤器快速拒绝：确定不在英语词表中的token不值得查询
+        if self.english_filter is not None and word not in self.english_filter:
+            result = ("释义未找到", "音标未找到")
+            self.cache[word] = result
+            return result
+
+        # 先查持久化缓存
+        with self._shelf_lock:
+            cached = self.shelf.get(word)
+        if cached is not None:
+            self.cache[word] = cached
+            return cached
+
+        # 合并并发的重复查询：只有第一个请求真正发起网络调用
+        with self._in_flight_lock:
+            event = self._in_flight.get(word)
+            if event is None:
+                event = threading.Event()
+                self._in_flight[word] = event
+                is_owner = True
+            else:
+                is_owner = False
+
+        if not is_owner:
+            event.wait()
+            return self.cache.get(word, ("释义未找到", "音标未找到"))
+
+        try:
+            return self._fetch_word_info(word)
+        finally:
+            with self._in_flight_lock:
+                self._in_flight.pop(word, None)
+            event.set()
+
+    def _fetch_word_info(self, word: str) -> Tuple[str, str]:
+        """实际发起网络请求查询单词信息"""
+        self.rate_limiter.acquire()
         try:
             # 使用Free Dictionary API
             url = f"https://api.dictionaryapi.dev/api/v2/entries/en/{word}"
-            response = requests.get(url, timeout=10)
+            response = self.session.get(url, timeout=10)
             
             if response.status_code == 200:
                 data = response.json()[0]
@@ -117,6 +380,8 @@ class PDFVocabularyExtractor:
             result = ("释义未找到", "音标未找到")
         
         self.cache[word] = result
+        with self._shelf_lock:
+            self.shelf[word] = result
         return result
     
     def generate_vocabulary_pdf(self, words_info: List[WordInfo], output_path: str):
@@ -129,14 +394,11 @@ class PDFVocabularyExtractor:
         title = Paragraph("PDF词汇表", styles['Title'])
         story.append(title)
         
-        # 创建表格数据
-        data = [['单词', '音标', '释义']]
-        for word_info in sorted(words_info, key=lambda x: x.word.lower()):
-            data.append([
-                word_info.word,
-                word_info.pronunciation,
-                word_info.definition
-            ])
+        # 创建表格数据：一次列表推导批量生成行（元组行比列表行更省内存）
+        # 单词在提取阶段已统一为小写，attrgetter避免每个元素再调用lower()
+        data = [('单词', '音标', '释义')]
+        data += [(word_info.word, word_info.pronunciation, word_info.definition)
+                 for word_info in sorted(words_info, key=attrgetter('word'))]
         
         # 创建表格
         table = Table(data, colWidths=[100, 150, 300])
@@ -160,24 +422,29 @@ class PDFVocabularyExtractor:
         """处理PDF文件"""
         print(f"正在处理: {input_path}")
         
-        # 1. 提取文本
-        print("正在提取文本...")
-        text = self.extract_text_from_pdf(input_path)
-        
-        # 2. 提取单词
-        print("正在提取单词...")
-        words = self.extract_english_words(text)
+        # 1+2. 逐页提取文本并提取单词（流式处理，峰值内存与单页成正比）
+        print("正在提取文本和单词...")
+        unique_words: Dict[str, None] = {}
+        for page_text in self.iter_page_texts(input_path):
+            unique_words.update(dict.fromkeys(self.extract_english_words(page_text)))
+        words = list(unique_words)
         print(f"找到 {len(words)} 个唯一单词")
         
-        # 3. 查询词典
+        # 3. 查询词典（并发请求，瓶颈在网络I/O而非CPU）
         print("正在查询词典...")
-        words_info = []
-        for i, word in enumerate(words):
-            if i % 10 == 0:
-                print(f"进度: {i}/{len(words)}")
-            
-            definition, pronunciation = self.query_word_info(word)
-            words_info.append(WordInfo(word, definition, pronunciation))
+        results = {}
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            # 防御性去重：调用方可能传入含重复项的原始列表
+            future_to_word = {executor.submit(self.query_word_info, word): word
+                              for word in dict.fromkeys(words)}
+            for i, future in enumerate(as_completed(future_to_word)):
+                if i % 10 == 0:
+                    print(f"进度: {i}/{len(words)}")
+                word = future_to_word[future]
+                results[word] = future.result()
+
+        # 按原始顺序组装结果
+        words_info = [WordInfo(word, *results[word]) for word in words]
         
         # 4. 生成PDF
         print("正在生成PDF...")
@@ -48,6 +48,8 @@ class ConfigManager(ConfigManagerInterface):
         """
         self._config = self.DEFAULT_CONFIG.copy()
         self._config_path = config_path
+        # 已解析键的缓存：免去热路径上重复的split和逐层字典查找
+        self._lookup_cache: Dict[str, Any] = {}
         
         # 尝试加载配置文件
         if config_path and Path(config_path).exists():
@@ -64,15 +66,22 @@ class ConfigManager(ConfigManagerInterface):
         
         支持点号分隔的嵌套键，如 'api.timeout'
         """
-        keys = key.split('.')
+        try:
+            return self._lookup_cache[key]
+        except KeyError:
+            pass
+
         value = self._config
-        
+
         try:
-            for k in keys:
+            for k in key.split('.'):
                 value = value[k]
-            return value
         except (KeyError, TypeError):
+            # 未命中的键不缓存：不同调用点可能传入不同default
             return default
+
+        self._lookup_cache[key] = value
+        return value
     
     def set(self, key: str, value: Any):
         """设置配置值
@@ -90,6 +99,7 @@ class ConfigManager(ConfigManagerInterface):
         
         # 设置最终值
         config[keys[-1]] = value
+        self._lookup_cache.clear()
     
     def load_config(self, config_path: Optional[str] = None):
         """加载配置文件"""
@@ -174,6 +184,7 @@ class ConfigManager(ConfigManagerInterface):
     
     def _merge_config(self, base: Dict, update: Dict):
         """递归合并配置字典"""
+        self._lookup_cache.clear()
         for key, value in update.items():
             if key in base and isinstance(base[key], dict) and isinstance(value, dict):
                 self._merge_config(base[key], value)
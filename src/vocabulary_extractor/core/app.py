@@ -106,9 +106,14 @@ class VocabularyExtractorApp:
             word_info_dict = self.dictionary_service.batch_lookup(unique_words)
             vocabulary = list(word_info_dict.values())
             
-            # 统计成功获取信息的单词数量
-            successful_definitions = sum(1 for w in vocabulary if w.found_definition)
-            successful_pronunciations = sum(1 for w in vocabulary if w.found_pronunciation)
+            # 统计成功获取信息的单词数量（单次遍历同时累加两个计数）
+            successful_definitions = 0
+            successful_pronunciations = 0
+            for w in vocabulary:
+                if w.found_definition:
+                    successful_definitions += 1
+                if w.found_pronunciation:
+                    successful_pronunciations += 1
             
             if self.progress_tracker:
                 self.progress_tracker.complete_step(
@@ -184,26 +189,31 @@ class VocabularyExtractorApp:
         """
         try:
             path = Path(file_path)
-            
-            # 检查文件是否存在
-            if not path.exists():
-                return False, "文件不存在"
-            
-            # 检查文件扩展名
+
+            # 检查文件扩展名（最廉价的检查放最前）
             if path.suffix.lower() not in self.get_supported_formats():
                 return False, f"不支持的文件格式: {path.suffix}"
-            
-            # 检查文件大小
+
+            # 单次stat同时覆盖存在性和大小检查
+            try:
+                file_size_mb = path.stat().st_size / (1024 * 1024)
+            except FileNotFoundError:
+                return False, "文件不存在"
+
             max_size_mb = self.config_manager.get('processing.max_file_size_mb', 50)
-            file_size_mb = path.stat().st_size / (1024 * 1024)
             if file_size_mb > max_size_mb:
                 return False, f"文件过大: {file_size_mb:.1f}MB (最大: {max_size_mb}MB)"
-            
+
+            # 魔数快速拒绝：非PDF文件无需走完整的解析验证
+            with open(file_path, 'rb') as f:
+                if f.read(5) != b'%PDF-':
+                    return False, "PDF文件格式无效或已损坏"
+
             # 验证PDF文件
             if not self.pdf_processor.validate_pdf(file_path):
                 return False, "PDF文件格式无效或已损坏"
-            
+
             return True, ""
-            
+
         except Exception as e:
             return False, f"文件验证错误: {str(e)}"
\ No newline at end of file
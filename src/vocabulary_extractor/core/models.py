@@ -7,32 +7,56 @@
 - APIResponse: API响应模型
 """
 
+import sys
 from dataclasses import dataclass
 from typing import Optional
 
 
-@dataclass
 class WordInfo:
     """单词信息数据模型
-    
-    存储单词及其相关信息，包括中文释义和音标
+
+    存储单词及其相关信息，包括中文释义和音标。
+    字段存储在__slots__中以降低大词汇量下的单实例内存开销
+    （dataclass的带默认值字段会与__slots__冲突，故手写等价实现）
     """
-    word: str
-    definition: str = ""
-    pronunciation: str = ""
-    found_definition: bool = True
-    found_pronunciation: bool = True
-    
-    def __post_init__(self):
-        """后处理：标准化单词格式"""
-        self.word = self.word.lower().strip()
-    
+
+    __slots__ = ('word', 'definition', 'pronunciation',
+                 'found_definition', 'found_pronunciation')
+
+    def __init__(self,
+                 word: str,
+                 definition: str = "",
+                 pronunciation: str = "",
+                 found_definition: bool = True,
+                 found_pronunciation: bool = True):
+        # 标准化单词格式；已是小写时跳过lower()的字符串分配。
+        # intern后同一单词在各处（缓存键、频率统计等）共享一个str对象
+        word = word.strip()
+        self.word = sys.intern(
+            word if word.islower() or not word else word.lower())
+        self.definition = definition
+        self.pronunciation = pronunciation
+        self.found_definition = found_definition
+        self.found_pronunciation = found_pronunciation
+
+    def __repr__(self) -> str:
+        return (f"WordInfo(word={self.word!r}, definition={self.definition!r}, "
+                f"pronunciation={self.pronunciation!r}, "
+                f"found_definition={self.found_definition!r}, "
+                f"found_pronunciation={self.found_pronunciation!r})")
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, WordInfo):
+            return NotImplemented
+        return all(getattr(self, name) == getattr(other, name)
+                   for name in self.__slots__)
+
     @property
     def has_complete_info(self) -> bool:
         """检查是否有完整的单词信息"""
-        return (self.found_definition and 
-                self.found_pronunciation and 
-                self.definition and 
+        return (self.found_definition and
+                self.found_pronunciation and
+                self.definition and
                 self.pronunciation)
 
 
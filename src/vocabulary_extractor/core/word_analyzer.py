@@ -3,13 +3,25 @@
 """
 
 import re
+import heapq
 import logging
-from typing import List, Dict, Any
+from collections import Counter, defaultdict
+from typing import Iterator, List, Dict, Any, Tuple
 
 
 class WordAnalyzer:
     """专注于单词统计和分析的类"""
-    
+
+    # 技术词汇模式：常见技术性后缀或包含技术词根
+    # 合并为单个交替模式，每个单词只需一次正则扫描
+    TECHNICAL_PATTERN = re.compile(
+        r'(?:tion|ment|ology|ical|ize)$'
+        r'|algorithm|compute|system|process'
+    )
+
+    # 复合词模式：包含常见复合词词根
+    COMPOUND_PATTERN = re.compile(r'work|time|way|thing|self|over|under')
+
     def __init__(self):
         """初始化单词分析器"""
         self.logger = logging.getLogger(__name__)
@@ -33,33 +45,30 @@ class WordAnalyzer:
             }
         
         try:
-            word_frequencies = {}
+            word_frequencies = Counter()
             normalized_to_original = {}
-            
+
             for original_word in words:
                 if not isinstance(original_word, str) or not original_word.strip():
                     continue
-                
+
                 normalized = original_word.lower().strip()
                 if not normalized:
                     continue
-                
-                # 统计频率
-                if normalized in word_frequencies:
-                    word_frequencies[normalized] += 1
-                else:
-                    word_frequencies[normalized] = 1
-                    # 保存第一次出现的原始形式
-                    if normalized not in normalized_to_original:
-                        normalized_to_original[normalized] = original_word
-            
-            # 按频率排序
-            sorted_by_frequency = sorted(word_frequencies.items(), key=lambda x: x[1], reverse=True)
+
+                # 统计频率（Counter的C实现替代手动的字典判断/累加）
+                word_frequencies[normalized] += 1
+                # 保存第一次出现的原始形式
+                if normalized not in normalized_to_original:
+                    normalized_to_original[normalized] = original_word
+
+            # 按频率排序（Counter.most_common内部使用堆排序）
+            sorted_by_frequency = word_frequencies.most_common()
             unique_words = [word for word, freq in sorted_by_frequency]
-            
+
             return {
                 'words': unique_words,
-                'frequencies': word_frequencies,
+                'frequencies': dict(word_frequencies),
                 'total_unique': len(unique_words),
                 'most_common': sorted_by_frequency[:10],
                 'original_forms': normalized_to_original
@@ -68,6 +77,33 @@ class WordAnalyzer:
         except Exception as e:
             raise ValueError(f"频率分析失败: {str(e)}")
     
+    def analyze_frequency_iter(self, words: List[str]) -> Iterator[Tuple[str, int]]:
+        """按频率降序惰性产出(单词, 次数)元组
+
+        基于堆逐个弹出而非一次性排序，调用方只消费前若干项
+        （或边迭代边写出）时不必为完整的排序列表付出峰值内存。
+
+        Args:
+            words: 原始单词列表
+
+        Yields:
+            Tuple[str, int]: 按频率从高到低的(单词, 出现次数)
+        """
+        if not words:
+            return
+
+        word_frequencies = Counter(
+            word.lower().strip() for word in words
+            if isinstance(word, str) and word.strip())
+        word_frequencies.pop('', None)
+
+        # 负频率构建最小堆，弹出顺序即频率降序
+        heap = [(-count, word) for word, count in word_frequencies.items()]
+        heapq.heapify(heap)
+        while heap:
+            negative_count, word = heapq.heappop(heap)
+            yield word, -negative_count
+
     def group_by_characteristics(self, words: List[str]) -> Dict[str, Any]:
         """按特征分组单词
         
@@ -86,26 +122,18 @@ class WordAnalyzer:
             }
         
         try:
-            # 标准化单词
-            normalized_words = list(set(w.lower().strip() for w in words if w))
-            normalized_words = [w for w in normalized_words if w]
+            # 标准化并保序去重（dict.fromkeys保持首次出现顺序，结果可复现）
+            normalized_words = [w for w in dict.fromkeys(
+                w.lower().strip() for w in words if w) if w]
             
-            # 按长度分组
-            by_length = {}
+            # 按长度和首字母分组（defaultdict免去每词的成员判断）
+            by_length = defaultdict(list)
+            by_first_letter = defaultdict(list)
             for word in normalized_words:
-                length = len(word)
-                if length not in by_length:
-                    by_length[length] = []
-                by_length[length].append(word)
-            
-            # 按首字母分组
-            by_first_letter = {}
-            for word in normalized_words:
-                if word:  # 确保单词不为空
-                    first_letter = word[0].upper()
-                    if first_letter not in by_first_letter:
-                        by_first_letter[first_letter] = []
-                    by_first_letter[first_letter].append(word)
+                by_length[len(word)].append(word)
+                by_first_letter[word[0].upper()].append(word)
+            by_length = dict(by_length)
+            by_first_letter = dict(by_first_letter)
             
             # 按模式分组
             simple_words = []
@@ -161,55 +189,40 @@ class WordAnalyzer:
                 'length_distribution': {}
             }
         
-        unique_words = list(set(word.lower().strip() for word in words if word))
-        word_lengths = [len(word) for word in unique_words]
-        
-        # 长度分布统计
-        length_distribution = {}
-        for length in word_lengths:
-            length_distribution[length] = length_distribution.get(length, 0) + 1
-        
+        unique_words = list(dict.fromkeys(word.lower().strip() for word in words if word))
+
+        # 单词长度有界，用按长度下标的平坦计数数组（bincount方式）
+        # 替代哈希字典计数；总长在同一趟循环中累加，
+        # min/max/avg直接从计数数组导出，省去对长度列表的三次扫描
+        length_counts = [0] * 33
+        total_length = 0
+        for word in unique_words:
+            length = len(word)
+            if length >= len(length_counts):
+                length_counts.extend([0] * (length + 1 - len(length_counts)))
+            length_counts[length] += 1
+            total_length += length
+
+        nonzero_lengths = [i for i, count in enumerate(length_counts) if count]
+        length_distribution = {i: length_counts[i] for i in nonzero_lengths}
+
         return {
             'total_words': len(words),
             'unique_words': len(unique_words),
-            'avg_word_length': sum(word_lengths) / len(word_lengths) if word_lengths else 0.0,
-            'min_word_length': min(word_lengths) if word_lengths else 0,
-            'max_word_length': max(word_lengths) if word_lengths else 0,
+            'avg_word_length': total_length / len(unique_words) if unique_words else 0.0,
+            'min_word_length': nonzero_lengths[0] if nonzero_lengths else 0,
+            'max_word_length': nonzero_lengths[-1] if nonzero_lengths else 0,
             'length_distribution': length_distribution
         }
     
     def _is_technical_word(self, word: str) -> bool:
         """判断是否为技术词汇"""
-        technical_patterns = [
-            r'.*tion$',  # -tion结尾
-            r'.*ment$',  # -ment结尾
-            r'.*ology$', # -ology结尾
-            r'.*ical$',  # -ical结尾
-            r'.*ize$',   # -ize结尾
-            r'.*algorithm.*', # 包含algorithm
-            r'.*compute.*',   # 包含compute
-            r'.*system.*',    # 包含system
-            r'.*process.*',   # 包含process
-        ]
-        
-        word_lower = word.lower()
-        return any(re.match(pattern, word_lower) for pattern in technical_patterns)
-    
+        return self.TECHNICAL_PATTERN.search(word.lower()) is not None
+
     def _is_compound_word(self, word: str) -> bool:
         """判断是否为复合词"""
         # 简单判断：长度较长且包含常见复合词模式
         if len(word) < 8:
             return False
-        
-        compound_patterns = [
-            r'.*work.*',    # 包含work
-            r'.*time.*',    # 包含time
-            r'.*way.*',     # 包含way
-            r'.*thing.*',   # 包含thing
-            r'.*self.*',    # 包含self
-            r'.*over.*',    # 包含over
-            r'.*under.*',   # 包含under
-        ]
-        
-        word_lower = word.lower()
-        return any(re.search(pattern, word_lower) for pattern in compound_patterns)
\ No newline at end of file
+
+        return self.COMPOUND_PATTERN.search(word.lower()) is not None
\ No newline at end of file
@@ -4,9 +4,10 @@
 
 import re
 import logging
-from typing import List
+from typing import Iterator, List
 
 from vocabulary_extractor.core.interfaces import VocabularyExtractorInterface
+from vocabulary_extractor.core.word_normalizer import WordNormalizer
 
 
 class WordExtractor(VocabularyExtractorInterface):
@@ -17,6 +18,37 @@ class WordExtractor(VocabularyExtractorInterface):
     
     # 更严格的英语单词模式 - 至少2个字符，不含数字
     STRICT_ENGLISH_PATTERN = re.compile(r'\b[A-Za-z]{2,}\b')
+
+    # 噪声内容模式 - HTML标签、URL、www链接、邮箱和特殊字符
+    # 合并为单个交替模式，预处理只需一次替换扫描
+    NOISE_PATTERN = re.compile(
+        r'<[^>]+>'           # HTML标签
+        r'|http[s]?://\S+'   # URL
+        r'|www\.\S+'         # www链接
+        r'|\S+@\S+\.\S+'     # 邮箱
+        r"|[^\w\s\-\']"      # 特殊字符
+    )
+
+    # 连字符分隔的单词
+    HYPHEN_PATTERN = re.compile(r'\b(\w+)-(\w+)\b')
+
+    # 所有格（如 word's -> word）
+    POSSESSIVE_S_PATTERN = re.compile(r"(\w+)'s\b")
+    POSSESSIVE_PATTERN = re.compile(r"(\w+)'\b")
+
+    # 连续空白字符
+    WHITESPACE_PATTERN = re.compile(r'\s+')
+
+    # ASCII字节转换表：字母/数字/下划线保留为词元成分，其余映射为空格。
+    # '?'同样保留在词元内：预处理后的文本中'?'只可能来自非ASCII字符的
+    # 替换（encode 'replace'），留在词元内可使含非ASCII字符的词被
+    # isalpha过滤掉，与正则\b语义下"不匹配"的结果一致
+    _ASCII_TOKEN_TABLE = bytes(
+        b if (48 <= b <= 57 or 65 <= b <= 90 or 97 <= b <= 122
+              or b in (0x3F, 0x5F))
+        else 0x20
+        for b in range(256)
+    )
     
     def __init__(self, strict_mode: bool = False):
         """初始化单词提取器
@@ -45,9 +77,18 @@ class WordExtractor(VocabularyExtractorInterface):
         try:
             # 预处理文本
             cleaned_text = self._preprocess_text(text)
-            
-            # 使用正则表达式提取单词
-            words = self.word_pattern.findall(cleaned_text)
+
+            if not self.strict_mode:
+                # 快路径：字节translate+split以C级速度切分词元，
+                # 纯字母词元与ENGLISH_WORD_PATTERN的匹配结果等价，
+                # 避免为海量匹配逐个驱动正则状态机
+                tokens = (cleaned_text.encode('ascii', 'replace')
+                          .translate(self._ASCII_TOKEN_TABLE).split())
+                words = [token.decode('ascii')
+                         for token in tokens if token.isalpha()]
+            else:
+                # 严格模式使用正则表达式提取单词
+                words = self.word_pattern.findall(cleaned_text)
             
             self.logger.info(f"从{len(text)}字符的文本中提取到{len(words)}个单词")
             return words
@@ -55,6 +96,44 @@ class WordExtractor(VocabularyExtractorInterface):
         except Exception as e:
             raise ValueError(f"单词提取失败: {str(e)}")
     
+    def iter_normalized(self, text: str,
+                        normalizer: WordNormalizer) -> Iterator[str]:
+        """融合提取与标准化的生成器
+
+        提取出的单词立即标准化并验证，逐个产出有效结果，
+        不构建中间单词列表；下游可直接消费
+        （如Counter(extractor.iter_normalized(text, normalizer))），
+        大文档下峰值内存随之下降。
+
+        Args:
+            text: 输入文本
+            normalizer: 用于标准化和验证的WordNormalizer实例
+
+        Yields:
+            str: 标准化后的有效单词（未去重，保持出现顺序）
+        """
+        if not text or not isinstance(text, str):
+            return
+
+        cleaned_text = self._preprocess_text(text)
+        normalize = normalizer._normalize_single_word
+        is_valid = normalizer._is_valid_normalized_word
+
+        if not self.strict_mode:
+            # 与extract_words相同的字节快路径，但逐词元处理
+            tokens = (cleaned_text.encode('ascii', 'replace')
+                      .translate(self._ASCII_TOKEN_TABLE).split())
+            for token in tokens:
+                if token.isalpha():
+                    normalized = normalize(token.decode('ascii'))
+                    if normalized and is_valid(normalized):
+                        yield normalized
+        else:
+            for match in self.word_pattern.finditer(cleaned_text):
+                normalized = normalize(match.group())
+                if normalized and is_valid(normalized):
+                    yield normalized
+
     def extract_words_with_context(self, text: str, context_chars: int = 50) -> List[dict]:
         """提取单词并包含上下文信息
         
@@ -69,28 +148,24 @@ class WordExtractor(VocabularyExtractorInterface):
             return []
         
         try:
-            words_with_context = []
-            
-            # 找到所有匹配的单词及其位置
-            for match in self.word_pattern.finditer(text):
-                word = match.group()
-                start_pos = match.start()
-                end_pos = match.end()
-                
-                # 获取上下文
-                context_start = max(0, start_pos - context_chars)
-                context_end = min(len(text), end_pos + context_chars)
-                context = text[context_start:context_end]
-                
-                words_with_context.append({
+            text_length = len(text)
+
+            # 先收集所有匹配的位置信息，再用单个列表推导式批量构造结果，
+            # 避免逐条append的Python层循环开销
+            spans = [(m.group(), m.start(), m.end())
+                     for m in self.word_pattern.finditer(text)]
+
+            return [
+                {
                     'word': word,
                     'position': start_pos,
-                    'context': context.strip(),
-                    'length': len(word)
-                })
-            
-            return words_with_context
-            
+                    'context': text[max(0, start_pos - context_chars):
+                                    min(text_length, end_pos + context_chars)].strip(),
+                    'length': end_pos - start_pos
+                }
+                for word, start_pos, end_pos in spans
+            ]
+
         except Exception as e:
             raise ValueError(f"带上下文的单词提取失败: {str(e)}")
     
@@ -103,25 +178,17 @@ class WordExtractor(VocabularyExtractorInterface):
         Returns:
             str: 预处理后的文本
         """
-        # 移除HTML标签（简单处理）
-        text = re.sub(r'<[^>]+>', ' ', text)
-        
-        # 移除常见的非文本内容
-        text = re.sub(r'http[s]?://\S+', ' ', text)  # URL
-        text = re.sub(r'www\.\S+', ' ', text)  # www链接
-        text = re.sub(r'\S+@\S+\.\S+', ' ', text)  # 邮箱
-        
-        # 处理特殊字符 - 保留字母、数字、空格和基本标点
-        text = re.sub(r'[^\w\s\-\']', ' ', text)
-        
+        # 移除噪声内容（HTML标签/URL/www链接/邮箱/特殊字符）- 单次扫描
+        text = self.NOISE_PATTERN.sub(' ', text)
+
         # 处理连字符分隔的单词
-        text = re.sub(r'\b(\w+)-(\w+)\b', r'\1 \2', text)
-        
-        # 处理所有格（如 word's -> word s）
-        text = re.sub(r"(\w+)'s\b", r'\1', text)
-        text = re.sub(r"(\w+)'\b", r'\1', text)
-        
+        text = self.HYPHEN_PATTERN.sub(r'\1 \2', text)
+
+        # 处理所有格（如 word's -> word）
+        text = self.POSSESSIVE_S_PATTERN.sub(r'\1', text)
+        text = self.POSSESSIVE_PATTERN.sub(r'\1', text)
+
         # 标准化空白字符
-        text = re.sub(r'\s+', ' ', text)
-        
+        text = self.WHITESPACE_PATTERN.sub(' ', text)
+
         return text.strip()
\ No newline at end of file
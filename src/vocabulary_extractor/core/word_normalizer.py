@@ -3,14 +3,51 @@
 """
 
 import re
+import sys
 import logging
-from typing import List, Set
+from functools import lru_cache
+from typing import Iterator, List, Set
 
 
 class WordNormalizer:
     """专注于单词标准化和清理的类"""
-    
-    def __init__(self, 
+
+    # 非法字符模式（保留连字符用于后续处理）- 预编译避免每词重编译
+    STRIP_PATTERN = re.compile(r'[^\w\-]')
+
+    # 常见的停用词 - 类级frozenset，所有实例共享一份不可变集合
+    COMMON_STOP_WORDS = frozenset({
+        'a', 'an', 'and', 'are', 'as', 'at', 'be', 'by', 'for', 'from',
+        'has', 'he', 'in', 'is', 'it', 'its', 'of', 'on', 'that', 'the',
+        'to', 'was', 'were', 'will', 'with', 'the', 'this', 'but', 'they',
+        'have', 'had', 'what', 'said', 'each', 'which', 'she', 'do', 'how',
+        'their', 'if', 'up', 'out', 'many', 'then', 'them', 'these', 'so',
+        'some', 'her', 'would', 'make', 'like', 'into', 'him', 'time',
+        'two', 'more', 'go', 'no', 'way', 'could', 'my', 'than', 'first',
+        'been', 'call', 'who', 'oil', 'sit', 'now', 'find', 'down', 'day',
+        'did', 'get', 'come', 'made', 'may', 'part'
+    })
+
+    # 常见的非单词模式 - 类级元组，定义时编译一次
+    NON_WORD_PATTERNS = (
+        re.compile(r'^(www|http|https|ftp)$', re.IGNORECASE),  # 协议前缀
+        re.compile(r'^\d+$'),  # 纯数字
+    )
+
+    # 无元音单词的例外，如"gym", "try"等
+    VOWEL_EXCEPTIONS = frozenset(
+        {'gym', 'spy', 'try', 'dry', 'fly', 'sky', 'cry', 'why', 'shy'})
+
+    # 128项字符标志表：bit0=元音, bit1=辅音，单次遍历即可完成
+    # 元音存在性/全辅音/全元音三项检查
+    _CHAR_FLAGS = bytes(
+        (1 if chr(i) in 'aeiou'
+         else 2 if chr(i) in 'bcdfghjklmnpqrstvwxyz'
+         else 0)
+        for i in range(128)
+    )
+
+    def __init__(self,
                  min_word_length: int = 1,
                  max_word_length: int = 50,
                  include_stop_words: bool = True):
@@ -26,24 +63,40 @@ class WordNormalizer:
         self.include_stop_words = include_stop_words
         self.logger = logging.getLogger(__name__)
         
-        # 常见的停用词
-        self.COMMON_STOP_WORDS = {
-            'a', 'an', 'and', 'are', 'as', 'at', 'be', 'by', 'for', 'from',
-            'has', 'he', 'in', 'is', 'it', 'its', 'of', 'on', 'that', 'the',
-            'to', 'was', 'were', 'will', 'with', 'the', 'this', 'but', 'they',
-            'have', 'had', 'what', 'said', 'each', 'which', 'she', 'do', 'how',
-            'their', 'if', 'up', 'out', 'many', 'then', 'them', 'these', 'so',
-            'some', 'her', 'would', 'make', 'like', 'into', 'him', 'time',
-            'two', 'more', 'go', 'no', 'way', 'could', 'my', 'than', 'first',
-            'been', 'call', 'who', 'oil', 'sit', 'now', 'find', 'down', 'day',
-            'did', 'get', 'come', 'made', 'may', 'part'
-        }
-        
-        # 常见的非单词模式
-        self.NON_WORD_PATTERNS = [
-            re.compile(r'^(www|http|https|ftp)$', re.IGNORECASE),  # 协议前缀
-            re.compile(r'^\d+$'),  # 纯数字
-        ]
+        # 按实例缓存验证结果：文档中的单词高度重复，验证逻辑只需算一次
+        # （验证结果依赖实例配置，因此缓存绑定在实例而非类上）
+        self._is_valid_normalized_word = lru_cache(maxsize=8192)(
+            self._is_valid_normalized_word
+        )
+
+        # 为当前配置生成特化的快路径函数（长度边界折叠为常量）
+        self._fast_normalize = self._build_fast_normalizer()
+
+    def _build_fast_normalizer(self):
+        """运行时生成针对本实例配置特化的快路径标准化函数
+
+        配置在构造后不再变化，将长度边界直接折叠进生成代码，
+        省去热路径上每次调用的self属性读取。纯字母单词（绝大多数）
+        在此完成标准化；返回None表示需走完整的慢路径。
+
+        Returns:
+            callable: 特化后的快路径函数
+        """
+        source = (
+            "def _fast_norm(word, _intern=_intern):\n"
+            "    normalized = word.strip()\n"
+            "    if not normalized.islower():\n"
+            "        normalized = normalized.lower()\n"
+            "    if normalized.isalpha():\n"
+            f"        if {self.min_word_length} <= len(normalized)"
+            f" <= {self.max_word_length}:\n"
+            "            return _intern(normalized)\n"
+            "        return ''\n"
+            "    return None\n"
+        )
+        namespace = {'_intern': sys.intern}
+        exec(source, namespace)
+        return namespace['_fast_norm']
     
     def normalize_words(self, words: List[str]) -> List[str]:
         """标准化和去重单词列表
@@ -58,16 +111,17 @@ class WordNormalizer:
             return []
         
         try:
-            normalized_words = set()
-            
-            for word in words:
-                if isinstance(word, str) and word.strip():
-                    normalized_word = self._normalize_single_word(word)
-                    if normalized_word and self._is_valid_normalized_word(normalized_word):
-                        normalized_words.add(normalized_word)
-            
+            # 集合推导式单次遍历完成标准化+验证+去重
+            normalized_words = {
+                normalized_word
+                for word in words
+                if isinstance(word, str) and word.strip()
+                for normalized_word in (self._normalize_single_word(word),)
+                if normalized_word and self._is_valid_normalized_word(normalized_word)
+            }
+
             # 转换为列表并排序
-            result = sorted(list(normalized_words))
+            result = sorted(normalized_words)
             
             self.logger.info(f"标准化处理：{len(words)}个原始单词 -> {len(result)}个唯一单词")
             return result
@@ -75,6 +129,28 @@ class WordNormalizer:
         except Exception as e:
             raise ValueError(f"单词标准化失败: {str(e)}")
     
+    def normalize_words_iter(self, words: List[str]) -> 'Iterator[str]':
+        """惰性产出标准化后的唯一单词
+
+        与normalize_words等价的流式版本：按首次出现顺序逐个产出，
+        不构建完整的结果列表（也不排序），适合一次性消费的大输入。
+
+        Args:
+            words: 原始单词列表
+
+        Yields:
+            str: 标准化后的唯一有效单词（首次出现顺序）
+        """
+        seen = set()
+        for word in words:
+            if not isinstance(word, str) or not word.strip():
+                continue
+            normalized = self._normalize_single_word(word)
+            if (normalized and normalized not in seen
+                    and self._is_valid_normalized_word(normalized)):
+                seen.add(normalized)
+                yield normalized
+
     def normalize_with_stats(self, words: List[str]) -> dict:
         """标准化单词并返回详细统计信息
         
@@ -97,58 +173,67 @@ class WordNormalizer:
         try:
             normalized_words = set()
             invalid_words = []
-            duplicate_pairs = []
-            
-            # 跟踪处理详情
-            processing_details = {
-                'case_normalized': 0,
-                'punctuation_removed': 0,
-                'whitespace_trimmed': 0,
-                'duplicates_found': 0
-            }
-            
+            duplicate_count = 0
+            case_normalized = 0
+            whitespace_trimmed = 0
+
+            # 热路径局部绑定：百万级词表的循环里，属性查找和方法
+            # 重绑定的开销可观；统计计数也先累加在局部int上
+            normalize = self._normalize_single_word
+            is_valid = self._is_valid_normalized_word
+            seen = normalized_words
+            seen_add = normalized_words.add
+            invalid_append = invalid_words.append
+
             for original_word in words:
-                if not isinstance(original_word, str) or not original_word.strip():
-                    invalid_words.append(original_word)
+                if not isinstance(original_word, str):
+                    invalid_append(original_word)
                     continue
-                
-                # 执行标准化
-                normalized_word = self._normalize_single_word(original_word)
-                
-                if not normalized_word:
-                    invalid_words.append(original_word)
+
+                # strip结果复用：同时服务空白检查和trim统计，
+                # 避免原实现对同一单词的三次扫描
+                stripped = original_word.strip()
+                if not stripped:
+                    invalid_append(original_word)
                     continue
-                
-                if not self._is_valid_normalized_word(normalized_word):
-                    invalid_words.append(original_word)
+
+                normalized_word = normalize(original_word)
+
+                if not normalized_word or not is_valid(normalized_word):
+                    invalid_append(original_word)
                     continue
-                
+
                 # 检查是否已存在（重复）
-                if normalized_word in normalized_words:
-                    duplicate_pairs.append((original_word, normalized_word))
-                    processing_details['duplicates_found'] += 1
+                if normalized_word in seen:
+                    duplicate_count += 1
                 else:
-                    normalized_words.add(normalized_word)
-                
-                # 统计处理类型
-                if original_word != original_word.lower():
-                    processing_details['case_normalized'] += 1
-                if original_word != original_word.strip():
-                    processing_details['whitespace_trimmed'] += 1
-            
+                    seen_add(normalized_word)
+
+                # 统计处理类型（islower()短路掉已小写单词的lower()分配）
+                if (not original_word.islower()
+                        and original_word != original_word.lower()):
+                    case_normalized += 1
+                if original_word != stripped:
+                    whitespace_trimmed += 1
+
             # 转换为排序列表
-            result_list = sorted(list(normalized_words))
-            
+            result_list = sorted(normalized_words)
+
             return {
                 'normalized_words': result_list,
                 'original_count': len(words),
                 'unique_count': len(result_list),
                 'invalid_count': len(invalid_words),
-                'duplicate_count': len(duplicate_pairs),
-                'processing_details': processing_details,
+                'duplicate_count': duplicate_count,
+                'processing_details': {
+                    'case_normalized': case_normalized,
+                    'punctuation_removed': 0,
+                    'whitespace_trimmed': whitespace_trimmed,
+                    'duplicates_found': duplicate_count
+                },
                 'invalid_words': invalid_words[:10]
             }
-            
+
         except Exception as e:
             raise ValueError(f"单词标准化统计失败: {str(e)}")
     
@@ -163,26 +248,51 @@ class WordNormalizer:
         """
         if not word or not isinstance(word, str):
             return ""
-        
-        # 1. 去除首尾空白
+
+        # 快路径：特化函数处理纯字母单词（绝大多数情况），
+        # 跳过正则清理和连字符处理；intern使频率字典、缓存键等
+        # 下游引用共享同一str对象
+        result = self._fast_normalize(word)
+        if result is not None:
+            return result
+
+        # 慢路径：1. 去除首尾空白
         normalized = word.strip()
-        
-        # 2. 转换为小写
-        normalized = normalized.lower()
-        
+
+        # 2. 转换为小写（已是小写时跳过字符串分配）
+        if not normalized.islower():
+            normalized = normalized.lower()
+
         # 3. 移除非字母字符（但保留连字符用于后续处理）
-        normalized = re.sub(r'[^\w\-]', '', normalized)
+        normalized = self.STRIP_PATTERN.sub('', normalized)
         
-        # 4. 处理连字符分隔的单词 - 取所有有效部分
+        # 4. 处理连字符分隔的单词 - 单次find扫描取第一个有效片段：
+        #    不物化split的片段列表，且找到有效片段即停止切片
         if '-' in normalized:
-            parts = normalized.split('-')
-            # 选择所有有效的部分，而不是只选最长的
-            valid_parts = [part for part in parts if len(part) >= self.min_word_length and part.isalpha()]
-            if valid_parts:
-                # 返回第一个有效部分，而不是最长的
-                normalized = valid_parts[0]
+            min_len = self.min_word_length
+            chosen = None
+            first_part = None
+            start = 0
+
+            while True:
+                idx = normalized.find('-', start)
+                part = (normalized[start:idx] if idx != -1
+                        else normalized[start:])
+                if first_part is None:
+                    first_part = part
+                if len(part) >= min_len and part.isalpha():
+                    chosen = part
+                    break
+                if idx == -1:
+                    break
+                start = idx + 1
+
+            if chosen is not None:
+                normalized = chosen
+            elif first_part and first_part.isalpha():
+                normalized = first_part
             else:
-                normalized = parts[0] if parts and parts[0].isalpha() else ""
+                normalized = ""
         
         # 5. 最终验证：必须只包含字母
         if not normalized.isalpha():
@@ -191,8 +301,8 @@ class WordNormalizer:
         # 6. 长度检查
         if len(normalized) < self.min_word_length or len(normalized) > self.max_word_length:
             return ""
-        
-        return normalized
+
+        return sys.intern(normalized)
     
     def _is_valid_normalized_word(self, word: str) -> bool:
         """验证标准化后的单词是否有效
@@ -230,30 +340,58 @@ class WordNormalizer:
             bool: 是否具有有效结构
         """
         word_lower = word.lower()
-        
-        # 检查元音字母 - 英语单词通常包含至少一个元音
-        vowels = 'aeiou'
-        if len(word) >= 3 and not any(char in vowels for char in word_lower):
-            # 对于3个字符以上的单词，通常应该包含元音
-            # 但有一些例外，如"by", "my", "gym"等
-            exceptions = {'gym', 'spy', 'try', 'dry', 'fly', 'sky', 'cry', 'why', 'shy'}
-            if word_lower not in exceptions:
+
+        if word_lower.isascii():
+            # 单次遍历：标志表合并元音存在性、全辅音/全元音、
+            # 连续重复字符三项检查，替代一次生成器+两次正则匹配
+            flags = self._CHAR_FLAGS
+            has_vowel = False
+            char_class = 3  # bit0/bit1：仍可能全元音/全辅音
+            prev_char = ''
+            run_length = 1
+            max_run = 1
+
+            for char in word_lower:
+                char_flags = flags[ord(char)]
+                if char_flags & 1:
+                    has_vowel = True
+                char_class &= char_flags
+                if char == prev_char:
+                    run_length += 1
+                    if run_length > max_run:
+                        max_run = run_length
+                else:
+                    prev_char = char
+                    run_length = 1
+
+            length = len(word)
+
+            # 3个字符以上的单词通常应包含元音（少数例外除外）
+            if (length >= 3 and not has_vowel
+                    and word_lower not in self.VOWEL_EXCEPTIONS):
                 return False
-        
-        # 检查重复字符 - 避免过多重复字符的无意义字符串
-        if len(word) >= 4:
-            # 检查是否有超过3个连续相同字符
-            if re.search(r'(.)\1{3,}', word_lower):
+
+            # 避免超过3个连续相同字符的无意义字符串
+            if length >= 4 and max_run >= 4:
                 return False
-        
-        # 检查是否为常见的无意义字符组合
-        meaningless_patterns = [
-            r'^[bcdfghjklmnpqrstvwxyz]+$',  # 全辅音（超过2个字符）
-            r'^[aeiou]+$',  # 全元音（超过2个字符）
-        ]
-        
-        for pattern in meaningless_patterns:
-            if len(word) > 2 and re.match(pattern, word_lower):
+
+            # 全辅音或全元音的无意义字符组合（超过2个字符）
+            if length > 2 and char_class:
                 return False
-        
+
+            return True
+
+        # 非ASCII单词走原有的逐项检查路径
+        vowels = 'aeiou'
+        if len(word) >= 3 and not any(char in vowels for char in word_lower):
+            if word_lower not in self.VOWEL_EXCEPTIONS:
+                return False
+
+        if len(word) >= 4 and re.search(r'(.)\1{3,}', word_lower):
+            return False
+
+        if len(word) > 2 and (re.match(r'^[bcdfghjklmnpqrstvwxyz]+$', word_lower)
+                              or re.match(r'^[aeiou]+$', word_lower)):
+            return False
+
         return True
\ No newline at end of file
@@ -4,33 +4,66 @@
 提供内存缓存和持久化缓存功能，优化API查询性能
 """
 
+import atexit
 import json
+import queue
 import time
 import pickle
-import hashlib
+import sqlite3
+from collections import OrderedDict
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Any, Optional, Tuple
+from typing import Dict, Any, List, Optional, Tuple
 import logging
-from threading import Lock
+from threading import Lock, Thread
+
+
+# 待删除条目在写覆盖层中的墓碑标记
+_TOMBSTONE = object()
+
+
+@lru_cache(maxsize=8192)
+def _word_key(word: str) -> str:
+    """生成单词缓存键
+
+    导入时固定的模块级函数：无实例状态、无查询类型分支，
+    结果缓存在所有DictionaryCache实例间共享
+    """
+    return 'word:' + word.lower().strip()
 
 
 class CacheEntry:
-    """缓存条目"""
-    
+    """缓存条目
+
+    时间戳基于time.monotonic()：不受系统时钟调整影响，
+    且比time.time()省去部分平台上的系统调用。
+    字段存储在__slots__中，万级缓存条目下省去每条目的__dict__开销
+    """
+
+    __slots__ = ('data', 'timestamp', 'ttl')
+
     def __init__(self, data: Any, timestamp: float, ttl: Optional[float] = None):
         self.data = data
         self.timestamp = timestamp
         self.ttl = ttl  # Time to live in seconds
-    
-    def is_expired(self) -> bool:
-        """检查缓存是否过期"""
+
+    def is_expired(self, now: Optional[float] = None) -> bool:
+        """检查缓存是否过期
+
+        Args:
+            now: 当前单调时钟值；批量检查时传入以复用一次读数
+        """
         if self.ttl is None:
             return False
-        return time.time() - self.timestamp > self.ttl
-    
-    def age(self) -> float:
+        if now is None:
+            now = time.monotonic()
+        return now - self.timestamp > self.ttl
+
+    def age(self, now: Optional[float] = None) -> float:
         """获取缓存年龄（秒）"""
-        return time.time() - self.timestamp
+        if now is None:
+            now = time.monotonic()
+        return now - self.timestamp
 
 
 class MemoryCache:
@@ -45,190 +78,412 @@ class MemoryCache:
         """
         self.max_size = max_size
         self.default_ttl = default_ttl
-        self._cache: Dict[str, CacheEntry] = {}
-        self._access_order: Dict[str, float] = {}  # LRU tracking
-        self._lock = Lock()
         self.logger = logging.getLogger(__name__)
-    
+
+        # 分片锁：按键哈希划分到若干独立的(锁, OrderedDict)分片，
+        # 多线程批量查询命中不同分片时互不阻塞；
+        # 小容量缓存退化为单分片，保持精确的全局LRU语义。
+        # 每个OrderedDict按访问序维护条目（最久未用在队首），
+        # 命中/淘汰均为O(1)
+        self._num_shards = min(16, max(1, max_size // 64))
+        self._shard_size = max(1, max_size // self._num_shards)
+        self._shards = [(Lock(), OrderedDict())
+                        for _ in range(self._num_shards)]
+
+    def _shard(self, key: str) -> 'Tuple[Lock, OrderedDict]':
+        """按键哈希定位所属分片"""
+        return self._shards[hash(key) % self._num_shards]
+
     def get(self, key: str) -> Optional[Any]:
         """获取缓存数据"""
-        with self._lock:
-            if key not in self._cache:
+        lock, cache = self._shard(key)
+
+        # 未命中快路径：dict.get在GIL下本身是原子操作，
+        # 键不存在时直接返回，省去一次锁获取/释放
+        if cache.get(key) is None:
+            return None
+
+        with lock:
+            # 持锁后重读，条目可能在加锁间隙被删除或淘汰
+            entry = cache.get(key)
+            if entry is None:
                 return None
-            
-            entry = self._cache[key]
-            
+
             # 检查是否过期
             if entry.is_expired():
-                del self._cache[key]
-                if key in self._access_order:
-                    del self._access_order[key]
+                del cache[key]
                 return None
-            
-            # 更新访问时间
-            self._access_order[key] = time.time()
+
+            # 命中后移至队尾，标记为最近使用
+            cache.move_to_end(key)
             return entry.data
-    
+
     def set(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
         """设置缓存数据"""
-        with self._lock:
+        lock, cache = self._shard(key)
+        with lock:
             # 使用默认TTL如果没有指定
             if ttl is None:
                 ttl = self.default_ttl
-            
-            # 检查缓存大小限制
-            if len(self._cache) >= self.max_size and key not in self._cache:
-                self._evict_lru()
-            
-            # 添加新条目
-            self._cache[key] = CacheEntry(value, time.time(), ttl)
-            self._access_order[key] = time.time()
-    
+
+            # 检查分片大小限制
+            if len(cache) >= self._shard_size and key not in cache:
+                self._evict_lru(cache)
+
+            # 添加新条目（覆盖时同样移至队尾）
+            cache[key] = CacheEntry(value, time.monotonic(), ttl)
+            cache.move_to_end(key)
+
+    def set_fresh(self, key: str, value: Any,
+                  timestamp: Optional[float] = None) -> None:
+        """持久层命中后的快速回填路径
+
+        调用前提是键刚发生内存未命中，据此省去set()中的成员判断、
+        TTL参数分支和move_to_end（新插入本就在队尾）；批量回填时
+        传入timestamp可在多次调用间复用一次时钟读数。
+
+        Args:
+            key: 缓存键
+            value: 缓存数据
+            timestamp: 条目时间戳（单调时钟），None则现场读取
+        """
+        if timestamp is None:
+            timestamp = time.monotonic()
+        lock, cache = self._shard(key)
+        with lock:
+            if len(cache) >= self._shard_size:
+                self._evict_lru(cache)
+            cache[key] = CacheEntry(value, timestamp, self.default_ttl)
+
+    def get_many(self, keys: 'List[str]') -> Dict[str, Any]:
+        """批量获取缓存数据
+
+        按分片归组后每个分片只获取一次锁，摊销批量探测的加锁开销；
+        仅返回命中且未过期的键。
+
+        Args:
+            keys: 缓存键列表
+
+        Returns:
+            Dict[str, Any]: 命中的键到数据的映射
+        """
+        grouped: Dict[int, list] = {}
+        for key in keys:
+            grouped.setdefault(hash(key) % self._num_shards, []).append(key)
+
+        now = time.monotonic()
+        results: Dict[str, Any] = {}
+        for shard_index, shard_keys in grouped.items():
+            lock, cache = self._shards[shard_index]
+            with lock:
+                for key in shard_keys:
+                    entry = cache.get(key)
+                    if entry is None:
+                        continue
+                    if entry.is_expired(now):
+                        del cache[key]
+                        continue
+                    cache.move_to_end(key)
+                    results[key] = entry.data
+
+        return results
+
     def delete(self, key: str) -> bool:
         """删除缓存条目"""
-        with self._lock:
-            if key in self._cache:
-                del self._cache[key]
-                if key in self._access_order:
-                    del self._access_order[key]
+        lock, cache = self._shard(key)
+        with lock:
+            if key in cache:
+                del cache[key]
                 return True
             return False
-    
+
     def clear(self) -> None:
         """清空所有缓存"""
-        with self._lock:
-            self._cache.clear()
-            self._access_order.clear()
-    
-    def _evict_lru(self) -> None:
-        """移除最近最少使用的条目"""
-        if not self._access_order:
-            return
-        
-        # 找到最旧的访问时间
-        oldest_key = min(self._access_order.keys(), key=lambda k: self._access_order[k])
-        
-        # 删除最旧的条目
-        if oldest_key in self._cache:
-            del self._cache[oldest_key]
-        del self._access_order[oldest_key]
-    
+        for lock, cache in self._shards:
+            with lock:
+                cache.clear()
+
+    @staticmethod
+    def _evict_lru(cache: 'OrderedDict') -> None:
+        """移除分片中最近最少使用的条目（调用方需持分片锁）"""
+        if cache:
+            # 队首即最久未用条目
+            cache.popitem(last=False)
+
     def cleanup_expired(self) -> int:
         """清理过期条目"""
-        with self._lock:
-            expired_keys = []
-            for key, entry in self._cache.items():
-                if entry.is_expired():
-                    expired_keys.append(key)
-            
-            for key in expired_keys:
-                del self._cache[key]
-                if key in self._access_order:
-                    del self._access_order[key]
-            
-            return len(expired_keys)
-    
+        now = time.monotonic()
+        cleaned = 0
+        for lock, cache in self._shards:
+            with lock:
+                expired_keys = [key for key, entry in cache.items()
+                                if entry.is_expired(now)]
+                for key in expired_keys:
+                    del cache[key]
+                cleaned += len(expired_keys)
+
+        return cleaned
+
     def stats(self) -> Dict[str, Any]:
         """获取缓存统计信息"""
-        with self._lock:
-            total_entries = len(self._cache)
-            expired_count = sum(1 for entry in self._cache.values() if entry.is_expired())
-            
-            return {
-                'total_entries': total_entries,
-                'expired_entries': expired_count,
-                'active_entries': total_entries - expired_count,
-                'max_size': self.max_size,
-                'usage_ratio': total_entries / self.max_size if self.max_size > 0 else 0
-            }
+        now = time.monotonic()
+        total_entries = 0
+        expired_count = 0
+        for lock, cache in self._shards:
+            with lock:
+                total_entries += len(cache)
+                expired_count += sum(
+                    1 for entry in cache.values() if entry.is_expired(now))
+
+        return {
+            'total_entries': total_entries,
+            'expired_entries': expired_count,
+            'active_entries': total_entries - expired_count,
+            'max_size': self.max_size,
+            'usage_ratio': total_entries / self.max_size if self.max_size > 0 else 0
+        }
 
 
 class PersistentCache:
-    """持久化缓存管理器"""
-    
-    def __init__(self, cache_dir: str = ".cache", cache_file: str = "dictionary_cache.pkl"):
+    """持久化缓存管理器
+
+    基于SQLite键值表存储：单条写入为O(1)，读取按主键索引，
+    不再像整体pickle文件那样每次变更重写全部条目、
+    启动时也无需把全部缓存载入内存
+    """
+
+    def __init__(self, cache_dir: str = ".cache", cache_file: str = "dictionary_cache.db"):
         """初始化持久化缓存
-        
+
         Args:
             cache_dir: 缓存目录
-            cache_file: 缓存文件名
+            cache_file: 缓存数据库文件名
         """
         self.cache_dir = Path(cache_dir)
         self.cache_file = self.cache_dir / cache_file
         self.logger = logging.getLogger(__name__)
-        
+        self._lock = Lock()
+
         # 确保缓存目录存在
         self.cache_dir.mkdir(exist_ok=True)
-        
-        # 加载现有缓存
-        self._cache: Dict[str, CacheEntry] = {}
-        self._load_cache()
-    
-    def _load_cache(self) -> None:
-        """从文件加载缓存"""
-        if not self.cache_file.exists():
-            return
-        
+
         try:
-            with open(self.cache_file, 'rb') as f:
-                self._cache = pickle.load(f)
-            self.logger.info(f"加载持久化缓存: {len(self._cache)}个条目")
-        except Exception as e:
-            self.logger.warning(f"加载缓存文件失败: {str(e)}")
-            self._cache = {}
-    
-    def _save_cache(self) -> None:
-        """保存缓存到文件"""
+            self._conn = sqlite3.connect(str(self.cache_file),
+                                         check_same_thread=False)
+            # WAL模式下写入不阻塞读取，NORMAL同步足以保证缓存数据安全
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS cache ("
+                "key TEXT PRIMARY KEY, data BLOB, ts REAL, ttl REAL)")
+            self._conn.commit()
+            # 已知键集合：冷未命中（键根本不存在）直接返回，
+            # 不走SQL查询；键本身很短，内存代价远小于数据行
+            self._known_keys = {
+                row[0] for row in
+                self._conn.execute("SELECT key FROM cache")}
+        except sqlite3.Error as e:
+            self.logger.warning(f"打开缓存数据库失败: {str(e)}")
+            self._conn = None
+            self._known_keys = set()
+
+        # 写合并：变更先累积在事务中，达到阈值或flush时才提交，
+        # 批量写入时摊销掉每条一次的事务提交开销
+        # （进程异常退出最多丢失一批缓存条目，可随时重新查询补回）
+        self._pending_writes = 0
+        self._flush_every = 128
+
+        # 后台写线程：set/delete只把键入队即返回，序列化和磁盘I/O
+        # 由守护线程按批在单个事务中完成；待落盘的值保存在覆盖层
+        # 字典中，落盘前的读取仍能读到自己的写入
+        self._write_queue: 'queue.Queue' = queue.Queue()
+        self._pending_values: Dict[str, Any] = {}
+        if self._conn is not None:
+            self._writer_thread = Thread(target=self._writer_loop, daemon=True)
+            self._writer_thread.start()
+        else:
+            self._writer_thread = None
+
+        atexit.register(self.flush)
+
+    def _writer_loop(self) -> None:
+        """后台写线程：批量取出排队的键，在单个事务中落盘"""
+        while True:
+            keys = [self._write_queue.get()]
+            try:
+                # 尽量凑满一批，减少事务提交次数
+                while len(keys) < 256:
+                    keys.append(self._write_queue.get_nowait())
+            except queue.Empty:
+                pass
+
+            try:
+                with self._lock:
+                    wrote = False
+                    for key in dict.fromkeys(keys):
+                        pending = self._pending_values.pop(key, None)
+                        if pending is None:
+                            # 已被clear()清掉或被后续同键操作合并
+                            continue
+                        if pending is _TOMBSTONE:
+                            self._conn.execute(
+                                "DELETE FROM cache WHERE key = ?", (key,))
+                        else:
+                            value, timestamp, ttl = pending
+                            data = pickle.dumps(
+                                value, protocol=pickle.HIGHEST_PROTOCOL)
+                            self._conn.execute(
+                                "INSERT OR REPLACE INTO cache "
+                                "(key, data, ts, ttl) VALUES (?, ?, ?, ?)",
+                                (key, data, timestamp, ttl))
+                        wrote = True
+                    if wrote:
+                        self._conn.commit()
+            except (sqlite3.Error, pickle.PickleError) as e:
+                self.logger.error(f"后台写入持久化缓存失败: {str(e)}")
+            finally:
+                for _ in keys:
+                    self._write_queue.task_done()
+
+    def _mark_dirty(self) -> None:
+        """记录一次待提交的变更，累积到阈值时提交事务（调用方需持锁）"""
+        self._pending_writes += 1
+        if self._pending_writes >= self._flush_every:
+            self._conn.commit()
+            self._pending_writes = 0
+
+    def flush(self) -> None:
+        """等待排队的变更全部落盘并提交"""
+        if self._conn is None:
+            return
+
         try:
-            with open(self.cache_file, 'wb') as f:
-                pickle.dump(self._cache, f)
-        except Exception as e:
-            self.logger.error(f"保存缓存文件失败: {str(e)}")
-    
+            self._write_queue.join()
+            with self._lock:
+                if self._pending_writes:
+                    self._conn.commit()
+                    self._pending_writes = 0
+        except sqlite3.Error as e:
+            self.logger.error(f"提交持久化缓存失败: {str(e)}")
+
     def get(self, key: str) -> Optional[Any]:
         """获取缓存数据"""
-        if key not in self._cache:
+        if self._conn is None:
             return None
-        
-        entry = self._cache[key]
-        if entry.is_expired():
-            del self._cache[key]
+
+        # 冷未命中快路径：键不存在时省去SQL往返
+        if key not in self._known_keys:
             return None
-        
-        return entry.data
-    
+
+        # 写覆盖层：尚未落盘的写入直接从内存返回
+        with self._lock:
+            pending = self._pending_values.get(key)
+        if pending is not None:
+            if pending is _TOMBSTONE:
+                return None
+            value, timestamp, ttl = pending
+            if ttl is not None and time.time() - timestamp > ttl:
+                return None
+            return value
+
+        try:
+            with self._lock:
+                row = self._conn.execute(
+                    "SELECT data, ts, ttl FROM cache WHERE key = ?",
+                    (key,)).fetchone()
+                if row is None:
+                    return None
+
+                data, timestamp, ttl = row
+                if ttl is not None and time.time() - timestamp > ttl:
+                    self._conn.execute(
+                        "DELETE FROM cache WHERE key = ?", (key,))
+                    self._known_keys.discard(key)
+                    self._mark_dirty()
+                    return None
+
+                return pickle.loads(data)
+        except (sqlite3.Error, pickle.PickleError) as e:
+            self.logger.warning(f"读取持久化缓存失败: {str(e)}")
+            return None
+
     def set(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
-        """设置缓存数据"""
-        self._cache[key] = CacheEntry(value, time.time(), ttl)
-        self._save_cache()
-    
+        """设置缓存数据
+
+        仅更新覆盖层并把键入队，序列化与磁盘写入由后台线程完成，
+        调用方立即返回
+        """
+        if self._conn is None:
+            return
+
+        with self._lock:
+            self._pending_values[key] = (value, time.time(), ttl)
+            self._known_keys.add(key)
+        self._write_queue.put(key)
+
     def delete(self, key: str) -> bool:
         """删除缓存条目"""
-        if key in self._cache:
-            del self._cache[key]
-            self._save_cache()
-            return True
-        return False
-    
+        if self._conn is None:
+            return False
+
+        with self._lock:
+            existed = key in self._known_keys
+            if not existed:
+                return False
+            self._pending_values[key] = _TOMBSTONE
+            self._known_keys.discard(key)
+        self._write_queue.put(key)
+        return existed
+
     def clear(self) -> None:
         """清空所有缓存"""
-        self._cache.clear()
-        self._save_cache()
-    
+        if self._conn is None:
+            return
+
+        try:
+            with self._lock:
+                # 覆盖层一并清空：排队中的键落盘时会因无待写值而被跳过
+                self._pending_values.clear()
+                self._known_keys.clear()
+                self._conn.execute("DELETE FROM cache")
+                self._conn.commit()
+                self._pending_writes = 0
+        except sqlite3.Error as e:
+            self.logger.error(f"清空持久化缓存失败: {str(e)}")
+
     def cleanup_expired(self) -> int:
         """清理过期条目"""
-        expired_keys = []
-        for key, entry in self._cache.items():
-            if entry.is_expired():
-                expired_keys.append(key)
-        
-        for key in expired_keys:
-            del self._cache[key]
-        
-        if expired_keys:
-            self._save_cache()
-        
-        return len(expired_keys)
+        if self._conn is None:
+            return 0
+
+        # 先让排队的写入落盘，保证清理覆盖全部条目
+        self.flush()
+
+        try:
+            with self._lock:
+                cursor = self._conn.execute(
+                    "DELETE FROM cache WHERE ttl IS NOT NULL AND ? - ts > ttl",
+                    (time.time(),))
+                self._conn.commit()
+                self._pending_writes = 0
+                if cursor.rowcount:
+                    # 批量删除后重建已知键集合
+                    self._known_keys = {
+                        row[0] for row in
+                        self._conn.execute("SELECT key FROM cache")}
+                return cursor.rowcount
+        except sqlite3.Error as e:
+            self.logger.error(f"清理持久化缓存失败: {str(e)}")
+            return 0
+
+    def __len__(self) -> int:
+        """获取缓存条目数"""
+        if self._conn is None:
+            return 0
+
+        # 已知键集合同时覆盖落盘与待落盘条目
+        with self._lock:
+            return len(self._known_keys)
 
 
 class DictionaryCache:
@@ -254,79 +509,116 @@ class DictionaryCache:
         self.persistent_cache = PersistentCache(cache_dir)
         self.persistent_ttl = persistent_ttl
         self.logger = logging.getLogger(__name__)
-    
-    def _make_key(self, word: str, query_type: str) -> str:
-        """生成缓存键"""
-        # 使用hash确保键的一致性和长度限制
-        key_str = f"{query_type}:{word.lower().strip()}"
-        return hashlib.md5(key_str.encode()).hexdigest()
-    
-    def get_definition(self, word: str) -> Optional[str]:
-        """获取单词释义缓存"""
-        key = self._make_key(word, "definition")
-        
+
+    # 键计算绑定到模块级缓存函数：热路径上省去实例方法的
+    # 描述符开销，lru_cache结果跨实例复用
+    _make_key = staticmethod(_word_key)
+
+    def _get_entry(self, key: str) -> Optional[Dict[str, str]]:
+        """按键获取组合缓存条目（释义+音标存于同一条目）"""
         # 先检查内存缓存
-        result = self.memory_cache.get(key)
-        if result is not None:
-            return result
-        
+        entry = self.memory_cache.get(key)
+        if entry is not None:
+            return entry
+
         # 再检查持久化缓存
-        result = self.persistent_cache.get(key)
-        if result is not None:
-            # 将结果放入内存缓存
-            self.memory_cache.set(key, result)
-            return result
-        
+        entry = self.persistent_cache.get(key)
+        if entry is not None:
+            # 将结果回填内存缓存（快路径：刚发生内存未命中）
+            self.memory_cache.set_fresh(key, entry)
+            return entry
+
         return None
-    
+
+    def _set_entry(self, key: str, entry: Dict[str, str]) -> None:
+        """同时写入内存和持久化缓存"""
+        self.memory_cache.set(key, entry)
+        self.persistent_cache.set(key, entry, self.persistent_ttl)
+
+    def _update_field(self, word: str, field: str, value: str) -> None:
+        """更新组合条目中的单个字段，保留已有的另一字段"""
+        key = self._make_key(word)
+        entry = dict(self._get_entry(key) or {})
+        entry[field] = value
+        self._set_entry(key, entry)
+
+    def get_definition(self, word: str) -> Optional[str]:
+        """获取单词释义缓存"""
+        entry = self._get_entry(self._make_key(word))
+        return entry.get('definition') if entry else None
+
     def set_definition(self, word: str, definition: str) -> None:
         """设置单词释义缓存"""
-        key = self._make_key(word, "definition")
-        
-        # 同时设置内存和持久化缓存
-        self.memory_cache.set(key, definition)
-        self.persistent_cache.set(key, definition, self.persistent_ttl)
-    
+        self._update_field(word, 'definition', definition)
+
     def get_pronunciation(self, word: str) -> Optional[str]:
         """获取单词音标缓存"""
-        key = self._make_key(word, "pronunciation")
-        
-        # 先检查内存缓存
-        result = self.memory_cache.get(key)
-        if result is not None:
-            return result
-        
-        # 再检查持久化缓存
-        result = self.persistent_cache.get(key)
-        if result is not None:
-            # 将结果放入内存缓存
-            self.memory_cache.set(key, result)
-            return result
-        
-        return None
-    
+        entry = self._get_entry(self._make_key(word))
+        return entry.get('pronunciation') if entry else None
+
     def set_pronunciation(self, word: str, pronunciation: str) -> None:
         """设置单词音标缓存"""
-        key = self._make_key(word, "pronunciation")
-        
-        # 同时设置内存和持久化缓存
-        self.memory_cache.set(key, pronunciation)
-        self.persistent_cache.set(key, pronunciation, self.persistent_ttl)
-    
+        self._update_field(word, 'pronunciation', pronunciation)
+
     def get_word_info(self, word: str) -> Optional[Tuple[str, str]]:
-        """获取完整单词信息缓存"""
-        definition = self.get_definition(word)
-        pronunciation = self.get_pronunciation(word)
-        
+        """获取完整单词信息缓存
+
+        释义和音标同在一个组合条目中，单次键计算和缓存探测
+        即可取回两个字段
+        """
+        entry = self._get_entry(self._make_key(word))
+        if entry is None:
+            return None
+
+        definition = entry.get('definition')
+        pronunciation = entry.get('pronunciation')
         if definition is not None and pronunciation is not None:
             return definition, pronunciation
-        
+
         return None
-    
+
+    def get_word_info_batch(self, words: 'List[str]') -> Dict[str, Tuple[str, str]]:
+        """批量获取完整单词信息缓存
+
+        所有键一次算齐后对内存层做分片批量探测，
+        内存未命中的逐个查持久层并回填内存；
+        仅返回释义和音标均已缓存的单词。
+
+        Args:
+            words: 要查询的单词列表
+
+        Returns:
+            Dict[str, Tuple[str, str]]: 命中单词到(释义, 音标)的映射
+        """
+        keys = {word: self._make_key(word) for word in words}
+        memory_hits = self.memory_cache.get_many(list(keys.values()))
+
+        result: Dict[str, Tuple[str, str]] = {}
+        backfill_ts: Optional[float] = None
+        for word, key in keys.items():
+            entry = memory_hits.get(key)
+            if entry is None:
+                entry = self.persistent_cache.get(key)
+                if entry is not None:
+                    # 快路径回填内存缓存，整批共用一次时钟读数
+                    if backfill_ts is None:
+                        backfill_ts = time.monotonic()
+                    self.memory_cache.set_fresh(key, entry, backfill_ts)
+
+            if entry:
+                definition = entry.get('definition')
+                pronunciation = entry.get('pronunciation')
+                if definition is not None and pronunciation is not None:
+                    result[word] = (definition, pronunciation)
+
+        return result
+
     def set_word_info(self, word: str, definition: str, pronunciation: str) -> None:
         """设置完整单词信息缓存"""
-        self.set_definition(word, definition)
-        self.set_pronunciation(word, pronunciation)
+        self._set_entry(self._make_key(word), {
+            'definition': definition,
+            'pronunciation': pronunciation
+        })
     
     def clear_all(self) -> None:
         """清空所有缓存"""
@@ -351,7 +643,7 @@ class DictionaryCache:
         return {
             'memory_cache': memory_stats,
             'persistent_cache': {
-                'total_entries': len(self.persistent_cache._cache),
+                'total_entries': len(self.persistent_cache),
                 'cache_file': str(self.persistent_cache.cache_file)
             }
         }
\ No newline at end of file
@@ -6,6 +6,9 @@
 
 import time
 import logging
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from threading import Lock
 from typing import Dict, List, Optional, Any, Type
 from enum import Enum
 
@@ -30,6 +33,40 @@ class ServiceStatus(Enum):
     DISABLED = "disabled"
 
 
+class ServiceRecord:
+    """已注册服务的记录
+
+    __slots__属性取代字符串键字典：热路径上的字段访问是C级
+    槽位读取而非字典查找，单条记录内存也随之下降。
+    保留下标读写以兼容既有的字典式访问
+    """
+
+    __slots__ = ('service', 'priority', 'status', 'available',
+                 'failure_count', 'last_failure', 'last_success',
+                 'total_calls', 'successful_calls')
+
+    def __init__(self,
+                 service: DictionaryServiceInterface,
+                 priority: ServicePriority,
+                 enabled: bool = True):
+        self.service = service
+        self.priority = priority
+        self.status = ServiceStatus.ACTIVE if enabled else ServiceStatus.DISABLED
+        # 可用标志随状态变更维护，热路径只需读一个布尔值
+        self.available = enabled
+        self.failure_count = 0
+        self.last_failure: Optional[float] = None
+        self.last_success = time.time()
+        self.total_calls = 0
+        self.successful_calls = 0
+
+    def __getitem__(self, name: str) -> Any:
+        return getattr(self, name)
+
+    def __setitem__(self, name: str, value: Any) -> None:
+        setattr(self, name, value)
+
+
 class DictionaryServiceManager:
     """词典服务管理器
     
@@ -52,14 +89,19 @@ class DictionaryServiceManager:
             self.cache = None
         
         # 服务注册表
-        self.services: Dict[str, Dict[str, Any]] = {}
+        self.services: Dict[str, ServiceRecord] = {}
+
+        # 按优先级排序的服务名缓存（注册/启停服务时失效）
+        self._sorted_services: Optional[List[str]] = None
         
-        # 服务统计
+        # 服务统计：Counter的缺省零值免去每次get(name, 0)，
+        # 统计锁保护多线程批量查询下的读改写，避免撕裂更新
+        self._stats_lock = Lock()
         self.stats = {
             'total_requests': 0,
             'cache_hits': 0,
-            'service_calls': {},
-            'service_failures': {},
+            'service_calls': Counter(),
+            'service_failures': Counter(),
             'last_cleanup': time.time()
         }
         
@@ -70,6 +112,8 @@ class DictionaryServiceManager:
             'service_timeout': 10.0,
             'failure_threshold': 5,  # 连续失败次数阈值
             'recovery_time': 300,    # 服务恢复检查时间（秒）
+            'batch_chunk_size': 32,  # 批量查询的并发分块大小
+            'batch_max_workers': 8,  # 批量查询的最大并发线程数
         }
     
     def register_service(self, 
@@ -85,21 +129,15 @@ class DictionaryServiceManager:
             priority: 服务优先级
             enabled: 是否启用
         """
-        self.services[name] = {
-            'service': service,
-            'priority': priority,
-            'status': ServiceStatus.ACTIVE if enabled else ServiceStatus.DISABLED,
-            'failure_count': 0,
-            'last_failure': None,
-            'last_success': time.time(),
-            'total_calls': 0,
-            'successful_calls': 0
-        }
+        self.services[name] = ServiceRecord(service, priority, enabled)
         
         # 初始化统计
         self.stats['service_calls'][name] = 0
         self.stats['service_failures'][name] = 0
-        
+
+        # 服务集合变化，排序缓存失效
+        self._sorted_services = None
+
         self.logger.info(f"注册词典服务: {name} (优先级: {priority.name})")
     
     def setup_default_services(self, easy_pronunciation_api_key: Optional[str] = None):
@@ -132,7 +170,8 @@ class DictionaryServiceManager:
         if not word:
             return ""
         
-        self.stats['total_requests'] += 1
+        with self._stats_lock:
+            self.stats['total_requests'] += 1
         
         # 检查缓存
         if self.cache_enabled and self.cache:
@@ -149,7 +188,7 @@ class DictionaryServiceManager:
                 continue
             
             try:
-                result = service_info['service'].get_definition(word)
+                result = service_info.service.get_definition(word)
                 
                 # 记录成功调用
                 self._record_success(service_name)
@@ -179,7 +218,8 @@ class DictionaryServiceManager:
         if not word:
             return ""
         
-        self.stats['total_requests'] += 1
+        with self._stats_lock:
+            self.stats['total_requests'] += 1
         
         # 检查缓存
         if self.cache_enabled and self.cache:
@@ -196,7 +236,7 @@ class DictionaryServiceManager:
                 continue
             
             try:
-                result = service_info['service'].get_pronunciation(word)
+                result = service_info.service.get_pronunciation(word)
                 
                 # 记录成功调用
                 self._record_success(service_name)
@@ -227,22 +267,20 @@ class DictionaryServiceManager:
             return {}
         
         result = {}
-        uncached_words = []
-        
-        # 检查缓存
+
+        # 检查缓存（单次批量探测，每个分片只加一次锁）
         if self.cache_enabled and self.cache:
-            for word in words:
-                cached_info = self.cache.get_word_info(word)
-                if cached_info:
-                    definition, pronunciation = cached_info
-                    result[word] = WordInfo(
-                        word=word,
-                        definition=definition,
-                        pronunciation=pronunciation
-                    )
-                    self.stats['cache_hits'] += 1
-                else:
-                    uncached_words.append(word)
+            cached_batch = self.cache.get_word_info_batch(words)
+            for word, (definition, pronunciation) in cached_batch.items():
+                result[word] = WordInfo(
+                    word=word,
+                    definition=definition,
+                    pronunciation=pronunciation
+                )
+            # 整批命中数一次累加，且在锁内完成读改写
+            with self._stats_lock:
+                self.stats['cache_hits'] += len(cached_batch)
+            uncached_words = [word for word in words if word not in cached_batch]
         else:
             uncached_words = words
         
@@ -256,7 +294,8 @@ class DictionaryServiceManager:
                     continue
                 
                 try:
-                    batch_result = service_info['service'].batch_lookup(uncached_words)
+                    batch_result = self._call_batch_service(
+                        service_info.service, uncached_words)
                     
                     # 处理批量查询结果
                     for word, word_info in batch_result.items():
@@ -280,87 +319,138 @@ class DictionaryServiceManager:
                     continue
         
         # 确保所有单词都有结果（即使是空的）
+        # 本地绑定+位置参数构造占位对象，未命中较多时
+        # 省去逐词的全局名查找和关键字参数字典
+        make_word_info = WordInfo
         for word in words:
             if word not in result:
-                result[word] = WordInfo(
-                    word=word,
-                    definition="",
-                    pronunciation="",
-                    found_definition=False,
-                    found_pronunciation=False
-                )
-        
+                result[word] = make_word_info(word, "", "", False, False)
+
         return result
-    
+
+    def _call_batch_service(self,
+                            service: DictionaryServiceInterface,
+                            words: List[str]) -> Dict[str, WordInfo]:
+        """调用单个服务的批量查询接口
+
+        查询受HTTP往返延迟支配（I/O密集），大批量时按分块提交到
+        线程池并发执行，网络部分的吞吐随线程数近似线性提升；
+        小批量保持单次直接调用，不引入线程池开销。
+
+        Args:
+            service: 词典服务实例
+            words: 要查询的单词列表
+
+        Returns:
+            Dict[str, WordInfo]: 合并后的查询结果
+
+        Raises:
+            Exception: 所有分块都失败时抛出首个异常，由调用方降级
+        """
+        chunk_size = self.config['batch_chunk_size']
+        if len(words) <= chunk_size:
+            return service.batch_lookup(words)
+
+        chunks = [words[i:i + chunk_size]
+                  for i in range(0, len(words), chunk_size)]
+        merged: Dict[str, WordInfo] = {}
+        errors: List[Exception] = []
+
+        max_workers = min(self.config['batch_max_workers'], len(chunks))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [executor.submit(service.batch_lookup, chunk)
+                       for chunk in chunks]
+            for future in futures:
+                try:
+                    merged.update(future.result())
+                except Exception as e:
+                    # 单个分块失败不拖垮整批：对应单词留待占位填充
+                    errors.append(e)
+
+        if errors:
+            if not merged:
+                raise errors[0]
+            self.logger.warning(
+                f"批量查询有{len(errors)}个分块失败，已合并其余结果")
+
+        return merged
+
     def _get_services_by_priority(self) -> List[str]:
         """按优先级获取服务列表"""
-        # 按优先级排序服务
-        sorted_services = sorted(
-            self.services.items(),
-            key=lambda x: x[1]['priority'].value
-        )
-        
-        return [name for name, _ in sorted_services]
+        # 服务集合和优先级在注册后基本不变，排序结果缓存复用，
+        # 避免每次查询都重新排序
+        if self._sorted_services is None:
+            self._sorted_services = [
+                name for name, _ in sorted(
+                    self.services.items(),
+                    key=lambda x: x[1].priority.value
+                )
+            ]
+
+        return self._sorted_services
     
     def _is_service_available(self, service_name: str) -> bool:
         """检查服务是否可用"""
-        if service_name not in self.services:
+        service_info = self.services.get(service_name)
+        if service_info is None:
             return False
-        
-        service_info = self.services[service_name]
-        status = service_info['status']
-        
-        # 禁用的服务不可用
-        if status == ServiceStatus.DISABLED:
-            return False
-        
-        # 失败的服务检查是否可以恢复
-        if status == ServiceStatus.FAILED:
-            if service_info['last_failure']:
-                time_since_failure = time.time() - service_info['last_failure']
-                if time_since_failure > self.config['recovery_time']:
-                    # 尝试恢复服务
-                    service_info['status'] = ServiceStatus.ACTIVE
-                    service_info['failure_count'] = 0
-                    self.logger.info(f"服务 {service_name} 尝试恢复")
-                    return True
-            return False
-        
-        return True
+
+        # 快路径：可用标志在状态变更时维护，无需每次比较枚举链
+        if service_info.available:
+            return True
+
+        # 失败的服务检查是否可以恢复（禁用状态不参与恢复）
+        if (service_info.status == ServiceStatus.FAILED
+                and service_info.last_failure):
+            time_since_failure = time.time() - service_info.last_failure
+            if time_since_failure > self.config['recovery_time']:
+                # 尝试恢复服务
+                service_info.status = ServiceStatus.ACTIVE
+                service_info.available = True
+                service_info.failure_count = 0
+                self.logger.info(f"服务 {service_name} 尝试恢复")
+                return True
+
+        return False
     
     def _record_success(self, service_name: str):
         """记录服务成功调用"""
         if service_name in self.services:
             service_info = self.services[service_name]
-            service_info['successful_calls'] += 1
-            service_info['total_calls'] += 1
-            service_info['last_success'] = time.time()
-            service_info['failure_count'] = 0  # 重置失败计数
+            service_info.successful_calls += 1
+            service_info.total_calls += 1
+            service_info.last_success = time.time()
+            service_info.failure_count = 0  # 重置失败计数
             
             # 如果服务之前是降级状态，恢复为正常状态
-            if service_info['status'] == ServiceStatus.DEGRADED:
-                service_info['status'] = ServiceStatus.ACTIVE
+            if service_info.status == ServiceStatus.DEGRADED:
+                service_info.status = ServiceStatus.ACTIVE
                 self.logger.info(f"服务 {service_name} 恢复正常")
-        
-        self.stats['service_calls'][service_name] = self.stats['service_calls'].get(service_name, 0) + 1
+            service_info.available = service_info.status in (
+                ServiceStatus.ACTIVE, ServiceStatus.DEGRADED)
+
+        with self._stats_lock:
+            self.stats['service_calls'][service_name] += 1
     
     def _record_failure(self, service_name: str, error: Exception):
         """记录服务失败"""
         if service_name in self.services:
             service_info = self.services[service_name]
-            service_info['failure_count'] += 1
-            service_info['total_calls'] += 1
-            service_info['last_failure'] = time.time()
+            service_info.failure_count += 1
+            service_info.total_calls += 1
+            service_info.last_failure = time.time()
             
             # 根据失败次数调整服务状态
-            if service_info['failure_count'] >= self.config['failure_threshold']:
-                service_info['status'] = ServiceStatus.FAILED
+            if service_info.failure_count >= self.config['failure_threshold']:
+                service_info.status = ServiceStatus.FAILED
+                service_info.available = False
                 self.logger.warning(f"服务 {service_name} 标记为失败状态")
-            elif service_info['failure_count'] >= self.config['failure_threshold'] // 2:
-                service_info['status'] = ServiceStatus.DEGRADED
+            elif service_info.failure_count >= self.config['failure_threshold'] // 2:
+                service_info.status = ServiceStatus.DEGRADED
                 self.logger.warning(f"服务 {service_name} 标记为降级状态")
         
-        self.stats['service_failures'][service_name] = self.stats['service_failures'].get(service_name, 0) + 1
+        with self._stats_lock:
+            self.stats['service_failures'][service_name] += 1
         self.logger.error(f"服务 {service_name} 调用失败: {str(error)}")
     
     def get_service_status(self) -> Dict[str, Any]:
@@ -368,14 +458,14 @@ class DictionaryServiceManager:
         status = {}
         for name, info in self.services.items():
             status[name] = {
-                'status': info['status'].value,
-                'priority': info['priority'].name,
-                'failure_count': info['failure_count'],
-                'total_calls': info['total_calls'],
-                'successful_calls': info['successful_calls'],
-                'success_rate': info['successful_calls'] / info['total_calls'] if info['total_calls'] > 0 else 0,
-                'last_success': info['last_success'],
-                'last_failure': info['last_failure']
+                'status': info.status.value,
+                'priority': info.priority.name,
+                'failure_count': info.failure_count,
+                'total_calls': info.total_calls,
+                'successful_calls': info.successful_calls,
+                'success_rate': info.successful_calls / info.total_calls if info.total_calls > 0 else 0,
+                'last_success': info.last_success,
+                'last_failure': info.last_failure
             }
         
         return status
@@ -386,12 +476,18 @@ class DictionaryServiceManager:
         if self.cache_enabled and self.cache:
             cache_stats = self.cache.stats()
         
+        with self._stats_lock:
+            total_requests = self.stats['total_requests']
+            cache_hits = self.stats['cache_hits']
+            service_calls = dict(self.stats['service_calls'])
+            service_failures = dict(self.stats['service_failures'])
+
         return {
-            'total_requests': self.stats['total_requests'],
-            'cache_hits': self.stats['cache_hits'],
-            'cache_hit_rate': self.stats['cache_hits'] / self.stats['total_requests'] if self.stats['total_requests'] > 0 else 0,
-            'service_calls': self.stats['service_calls'],
-            'service_failures': self.stats['service_failures'],
+            'total_requests': total_requests,
+            'cache_hits': cache_hits,
+            'cache_hit_rate': cache_hits / total_requests if total_requests > 0 else 0,
+            'service_calls': service_calls,
+            'service_failures': service_failures,
             'services': self.get_service_status(),
             'cache': cache_stats
         }
@@ -407,7 +503,9 @@ class DictionaryServiceManager:
     def disable_service(self, service_name: str) -> bool:
         """禁用服务"""
         if service_name in self.services:
-            self.services[service_name]['status'] = ServiceStatus.DISABLED
+            self.services[service_name].status = ServiceStatus.DISABLED
+            self.services[service_name].available = False
+            self._sorted_services = None
             self.logger.info(f"服务 {service_name} 已禁用")
             return True
         return False
@@ -415,8 +513,10 @@ class DictionaryServiceManager:
     def enable_service(self, service_name: str) -> bool:
         """启用服务"""
         if service_name in self.services:
-            self.services[service_name]['status'] = ServiceStatus.ACTIVE
-            self.services[service_name]['failure_count'] = 0
+            self.services[service_name].status = ServiceStatus.ACTIVE
+            self.services[service_name].available = True
+            self.services[service_name].failure_count = 0
+            self._sorted_services = None
             self.logger.info(f"服务 {service_name} 已启用")
             return True
         return False
\ No newline at end of file
@@ -5,16 +5,36 @@
 """
 
 import time
+import random
 import logging
+import sqlite3
 import requests
+from requests.adapters import HTTPAdapter
+from collections import OrderedDict
+from functools import lru_cache
+from threading import Lock
 from typing import Dict, List, Optional, Any
 from abc import ABC, abstractmethod
 import json
 from urllib.parse import urljoin
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
 
 from ..core.interfaces import DictionaryServiceInterface
 from ..core.models import WordInfo, APIResponse
+from .cache import PersistentCache
+
+# 可选的高性能JSON解码器：orjson/ujson直接解码bytes，
+# 比stdlib快数倍且省去response.json()先解码为str的步骤；
+# 未安装时回退到标准库
+try:
+    import orjson
+    _fast_json_loads = orjson.loads
+except ImportError:
+    try:
+        import ujson
+        _fast_json_loads = ujson.loads
+    except ImportError:
+        _fast_json_loads = None
 
 
 class DictionaryServiceError(Exception):
@@ -49,9 +69,11 @@ class BaseDictionaryService(DictionaryServiceInterface):
                  timeout: int = 10,
                  max_retries: int = 3,
                  retry_delay: float = 1.0,
-                 max_workers: int = 5):
+                 max_workers: int = 5,
+                 persist_cache: bool = False,
+                 cache_dir: str = '.cache'):
         """初始化词典服务
-        
+
         Args:
             base_url: API基础URL
             api_key: API密钥
@@ -59,6 +81,8 @@ class BaseDictionaryService(DictionaryServiceInterface):
             max_retries: 最大重试次数
             retry_delay: 重试延迟（秒）
             max_workers: 并发请求的最大线程数
+            persist_cache: 是否将查询结果持久化到磁盘
+            cache_dir: 持久化缓存目录
         """
         self.base_url = base_url.rstrip('/')
         self.api_key = api_key
@@ -71,10 +95,31 @@ class BaseDictionaryService(DictionaryServiceInterface):
         # 创建会话对象
         self.session = requests.Session()
         self._setup_session()
-        
-        # 缓存
-        self._cache = {}
+
+        # 常驻线程池：跨批次复用，避免每次批量查询都支付线程
+        # 创建/销毁开销，工作线程与其连接保持亲和
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.max_workers, thread_name_prefix='dict-svc')
+
+        # 端点到完整URL的记忆表：服务只会访问少数几个固定端点，
+        # urljoin的解析只需每端点做一次而非每次请求
+        self._endpoint_urls: Dict[str, str] = {}
+        
+        # 缓存：有界LRU替代无界裸字典——并发批量查询下的读写
+        # 有锁保护，长驻进程的内存占用有上限；单词频率服从
+        # Zipf分布，较小的缓存即可覆盖绝大多数命中
+        self._cache: 'OrderedDict[str, Any]' = OrderedDict()
+        self._cache_maxsize = 10000
+        self._cache_lock = Lock()
         self._cache_enabled = True
+
+        # 可选的磁盘层：查询结果跨进程保留，重启后稳定词表
+        # 几乎不再消耗API调用；内存LRU仍承接Zipf头部的热词
+        if persist_cache:
+            self._persistent_cache = PersistentCache(
+                cache_dir, 'service_cache.db')
+        else:
+            self._persistent_cache = None
         
     def _setup_session(self):
         """设置HTTP会话"""
@@ -84,7 +129,19 @@ class BaseDictionaryService(DictionaryServiceInterface):
             'Accept': 'application/json',
             'Content-Type': 'application/json'
         })
-        
+
+        # 连接池与并发线程数匹配：默认适配器每主机只保留少量
+        # 可复用连接，并发超出时会丢弃并重建TCP+TLS连接，
+        # keep-alive形同虚设；重试交给自己的_make_request循环
+        adapter = HTTPAdapter(
+            pool_connections=self.max_workers,
+            pool_maxsize=max(self.max_workers * 2, 10),
+            pool_block=False,
+            max_retries=0
+        )
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+
         # 设置API认证
         if self.api_key:
             self._setup_authentication()
@@ -119,12 +176,16 @@ class BaseDictionaryService(DictionaryServiceInterface):
             APIAuthenticationError: 认证错误
             RateLimitError: 速率限制错误
         """
-        url = urljoin(self.base_url + '/', endpoint.lstrip('/'))
-        
+        url = self._endpoint_urls.get(endpoint)
+        if url is None:
+            url = urljoin(self.base_url + '/', endpoint.lstrip('/'))
+            self._endpoint_urls[endpoint] = url
+
         for attempt in range(self.max_retries + 1):
+            response = None
             try:
                 self.logger.debug(f"发送{method}请求到{url}，尝试{attempt + 1}/{self.max_retries + 1}")
-                
+
                 response = self.session.request(
                     method=method,
                     url=url,
@@ -133,24 +194,60 @@ class BaseDictionaryService(DictionaryServiceInterface):
                     timeout=self.timeout,
                     **kwargs
                 )
-                
+
                 # 检查响应状态
                 if response.status_code == 401:
+                    # 认证失败不可恢复，重试无意义，立即抛出
                     raise APIAuthenticationError("API认证失败，请检查API密钥")
                 elif response.status_code == 429:
                     raise RateLimitError("API请求频率过高，请稍后重试")
                 elif response.status_code >= 400:
                     raise HTTPClientError(f"HTTP请求失败: {response.status_code} - {response.text}")
-                
+
                 return response
-                
-            except (requests.exceptions.RequestException, HTTPClientError) as e:
+
+            except (requests.exceptions.RequestException,
+                    HTTPClientError, RateLimitError) as e:
                 if attempt == self.max_retries:
+                    if isinstance(e, RateLimitError):
+                        raise
                     raise HTTPClientError(f"HTTP请求失败（已重试{self.max_retries}次）: {str(e)}")
-                
-                # 等待后重试
-                time.sleep(self.retry_delay * (attempt + 1))
-                self.logger.warning(f"请求失败，{self.retry_delay * (attempt + 1)}秒后重试: {str(e)}")
+
+                # 指数退避加随机抖动：线性等待会让一批并发重试
+                # 同步撞向服务端，退避上限30秒
+                delay = min(self.retry_delay * (2 ** attempt), 30.0)
+                delay *= 1 + random.random() * 0.5
+
+                # 速率限制时优先采用服务端指示的Retry-After
+                if isinstance(e, RateLimitError) and response is not None:
+                    delay = max(delay, self._retry_after_seconds(response))
+
+                self.logger.warning(f"请求失败，{delay:.1f}秒后重试: {str(e)}")
+                time.sleep(delay)
+
+    @staticmethod
+    def _retry_after_seconds(response: requests.Response) -> float:
+        """解析响应中的Retry-After头（秒数或HTTP日期），上限30秒"""
+        try:
+            value = response.headers.get('Retry-After')
+        except Exception:
+            return 0.0
+        if not value:
+            return 0.0
+
+        try:
+            return min(max(float(value), 0.0), 30.0)
+        except (TypeError, ValueError):
+            pass
+
+        try:
+            from email.utils import parsedate_to_datetime
+            from datetime import datetime
+            target = parsedate_to_datetime(value)
+            seconds = (target - datetime.now(target.tzinfo)).total_seconds()
+            return min(max(seconds, 0.0), 30.0)
+        except (TypeError, ValueError):
+            return 0.0
     
     def _parse_response(self, response: requests.Response) -> Dict[str, Any]:
         """解析API响应
@@ -164,6 +261,15 @@ class BaseDictionaryService(DictionaryServiceInterface):
         Raises:
             DictionaryServiceError: 响应解析错误
         """
+        # 快路径：直接从原始bytes解码，跳过response.json()的
+        # 字符集探测和到str的解码
+        content = getattr(response, 'content', None)
+        if _fast_json_loads is not None and isinstance(content, (bytes, bytearray)):
+            try:
+                return _fast_json_loads(content)
+            except ValueError as e:
+                raise DictionaryServiceError(f"响应JSON解析失败: {str(e)}")
+
         try:
             return response.json()
         except json.JSONDecodeError as e:
@@ -173,22 +279,62 @@ class BaseDictionaryService(DictionaryServiceInterface):
         """从缓存获取数据"""
         if not self._cache_enabled:
             return None
-        return self._cache.get(key)
-    
+        with self._cache_lock:
+            value = self._cache.get(key)
+            if value is not None:
+                # 命中移至队尾，标记为最近使用
+                self._cache.move_to_end(key)
+                return value
+
+        # 内存未命中时查磁盘层，命中则回填内存
+        if self._persistent_cache is not None:
+            value = self._persistent_cache.get(key)
+            if value is not None:
+                self._set_memory_cache(key, value)
+            return value
+
+        return None
+
     def _set_cache(self, key: str, value: Any):
         """设置缓存数据"""
-        if self._cache_enabled:
+        if not self._cache_enabled:
+            return
+        self._set_memory_cache(key, value)
+        if self._persistent_cache is not None:
+            self._persistent_cache.set(key, value)
+
+    def _set_memory_cache(self, key: str, value: Any):
+        """仅写入内存LRU层"""
+        with self._cache_lock:
+            if key not in self._cache and len(self._cache) >= self._cache_maxsize:
+                # 淘汰队首的最久未用条目
+                self._cache.popitem(last=False)
             self._cache[key] = value
-    
+            self._cache.move_to_end(key)
+
     def clear_cache(self):
         """清空缓存"""
-        self._cache.clear()
+        with self._cache_lock:
+            self._cache.clear()
+        if self._persistent_cache is not None:
+            self._persistent_cache.clear()
     
     def enable_cache(self, enabled: bool = True):
         """启用或禁用缓存"""
         self._cache_enabled = enabled
         if not enabled:
             self.clear_cache()
+
+    def close(self):
+        """关闭线程池和HTTP会话"""
+        self._executor.shutdown(wait=True)
+        self.session.close()
+
+    def __enter__(self) -> 'BaseDictionaryService':
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
     
     # 抽象方法的默认实现，子类需要重写
     def get_definition(self, word: str) -> str:
@@ -200,28 +346,55 @@ class BaseDictionaryService(DictionaryServiceInterface):
         raise NotImplementedError("子类必须实现get_pronunciation方法")
     
     def batch_lookup(self, words: List[str]) -> Dict[str, WordInfo]:
-        """批量查询单词信息"""
-        result = {}
-        for word in words:
-            try:
-                definition = self.get_definition(word)
-                pronunciation = self.get_pronunciation(word)
-                
-                result[word] = WordInfo(
-                    word=word,
-                    definition=definition,
-                    pronunciation=pronunciation
-                )
-            except Exception as e:
-                self.logger.warning(f"查询单词'{word}'失败: {str(e)}")
-                # 创建空的WordInfo对象
-                result[word] = WordInfo(
-                    word=word,
-                    definition="",
-                    pronunciation=""
-                )
-        
-        return result
+        """批量查询单词信息（并发执行，查询瓶颈在网络I/O）"""
+        if not words:
+            return {}
+
+        # 先按标准化形式去重：分词输出中重复率很高，
+        # 每个唯一单词只发一次请求，再把结果广播回各原始形式
+        normalized_of = {word: word.strip().lower()
+                         for word in words if word and isinstance(word, str)}
+        unique_words = list(dict.fromkeys(normalized_of.values()))
+
+        lookup = {}
+        future_to_word = {
+            self._executor.submit(self._lookup_word, word): word
+            for word in unique_words
+        }
+
+        for future in as_completed(future_to_word):
+            word = future_to_word[future]
+            lookup[word] = future.result()
+
+        return {word: lookup[normalized]
+                for word, normalized in normalized_of.items()}
+
+    def _lookup_word(self, word: str) -> WordInfo:
+        """查询单个单词的释义和音标
+
+        Args:
+            word: 要查询的单词
+
+        Returns:
+            WordInfo: 单词信息（失败时返回空信息）
+        """
+        try:
+            definition = self.get_definition(word)
+            pronunciation = self.get_pronunciation(word)
+
+            return WordInfo(
+                word=word,
+                definition=definition,
+                pronunciation=pronunciation
+            )
+        except Exception as e:
+            self.logger.warning(f"查询单词'{word}'失败: {str(e)}")
+            # 创建空的WordInfo对象
+            return WordInfo(
+                word=word,
+                definition="",
+                pronunciation=""
+            )
 
 
 class EasyPronunciationService(BaseDictionaryService):
@@ -229,21 +402,43 @@ class EasyPronunciationService(BaseDictionaryService):
     
     DEFAULT_BASE_URL = "https://api.easypronunciation.com"
     
-    def __init__(self, api_key: str, **kwargs):
+    def __init__(self, api_key: str, use_batch_endpoint: bool = False, **kwargs):
         """初始化EasyPronunciation服务
-        
+
         Args:
             api_key: EasyPronunciation API密钥
+            use_batch_endpoint: 是否尝试批量查询端点
+                （公开文档未列出该端点，账号支持时可显式开启）
             **kwargs: 其他配置参数
         """
         # 提取base_url以避免重复传递
         base_url = kwargs.pop('base_url', self.DEFAULT_BASE_URL)
-        
+
+        # None表示已开启但尚未探测；False表示不可用（显式关闭
+        # 或探测到404/405后记住），避免反复撞不存在的端点
+        self._batch_supported: Optional[bool] = None if use_batch_endpoint else False
+
         super().__init__(
             base_url=base_url,
             api_key=api_key,
             **kwargs
         )
+
+        # 释义/音标请求对的共享执行器：两个HTTP往返并行发出，
+        # 单词耗时从2·RTT降到约1·RTT；独立于批量查询的线程池，
+        # 避免外层任务等待内层任务造成的池内死锁
+        self._pair_executor = ThreadPoolExecutor(
+            max_workers=self.max_workers, thread_name_prefix='dict-pair')
+
+        # 进行中请求登记表（single-flight）：同一单词的并发查询
+        # 只有第一个真正发起请求，其余等待同一个Future的结果
+        self._inflight: Dict[str, 'Future'] = {}
+        self._inflight_lock = Lock()
+
+    def close(self):
+        """关闭线程池和HTTP会话"""
+        self._pair_executor.shutdown(wait=True)
+        super().close()
     
     def _setup_authentication(self):
         """设置EasyPronunciation API认证"""
@@ -372,16 +567,111 @@ class EasyPronunciationService(BaseDictionaryService):
         """
         if not words:
             return {}
-        
-        result = {}
-        
+
+        # 去重后再分发：同一单词不会在缓存条目落地前触发多次请求
+        normalized_of = {word: word.strip().lower()
+                         for word in words if word and isinstance(word, str)}
+        unique_words = list(dict.fromkeys(normalized_of.values()))
+
         # 检查是否支持批量查询API
-        if hasattr(self, '_batch_lookup_api'):
-            return self._batch_lookup_api(words)
-        
-        # 使用并发查询优化性能
-        return self._concurrent_batch_lookup(words)
+        if self._batch_supported is not False:
+            lookup = self._batch_lookup_api(unique_words)
+        else:
+            # 使用并发查询优化性能
+            lookup = self._concurrent_batch_lookup(unique_words)
+
+        return {word: lookup[normalized]
+                for word, normalized in normalized_of.items()
+                if normalized in lookup}
     
+    def _batch_lookup_api(self, words: List[str]) -> Dict[str, WordInfo]:
+        """通过批量端点查询，一次请求替代每词两次往返
+
+        按50词分块并发POST到/v1/batch，摊销TLS、请求头和JSON
+        封包开销；端点返回404/405时记住不可用并永久回退到
+        并发逐词查询。
+
+        Args:
+            words: 要查询的单词列表（已标准化去重）
+
+        Returns:
+            Dict[str, WordInfo]: 单词信息字典
+        """
+        chunk_size = 50
+        chunks = [words[i:i + chunk_size]
+                  for i in range(0, len(words), chunk_size)]
+        futures = [self._executor.submit(self._request_batch_chunk, chunk)
+                   for chunk in chunks]
+
+        result: Dict[str, WordInfo] = {}
+        fallback_words: List[str] = []
+        for chunk, future in zip(chunks, futures):
+            try:
+                chunk_result = future.result()
+                result.update(chunk_result)
+                # 端点可能成功响应但遗漏部分单词：缺失的同样走逐词
+                # 回退，保证每个输入单词都有查询结果
+                if len(chunk_result) < len(chunk):
+                    fallback_words.extend(
+                        word for word in chunk if word not in chunk_result)
+            except Exception as e:
+                message = str(e)
+                if '404' in message or '405' in message:
+                    if self._batch_supported is not False:
+                        self._batch_supported = False
+                        self.logger.info("批量查询端点不可用，回退到并发逐词查询")
+                else:
+                    self.logger.warning(f"批量查询分块失败: {message}")
+                fallback_words.extend(chunk)
+
+        if result and self._batch_supported is None:
+            self._batch_supported = True
+
+        if fallback_words:
+            result.update(self._concurrent_batch_lookup(fallback_words))
+
+        return result
+
+    def _request_batch_chunk(self, chunk: List[str]) -> Dict[str, WordInfo]:
+        """请求一个分块的批量查询结果
+
+        Args:
+            chunk: 单词分块
+
+        Returns:
+            Dict[str, WordInfo]: 分块内单词的信息
+
+        Raises:
+            DictionaryServiceError: 请求失败或响应格式无效
+        """
+        response = self._make_request(
+            method='POST',
+            endpoint='/v1/batch',
+            data={
+                'words': chunk,
+                'fields': ['definition', 'pronunciation'],
+                'language': 'zh-CN'
+            }
+        )
+        data = self._parse_response(response)
+
+        # 兼容 {"results": {...}} 与直接按单词为键两种响应形态
+        entries = data.get('results', data) if isinstance(data, dict) else {}
+        result = {}
+        for word in chunk:
+            entry = entries.get(word)
+            if isinstance(entry, dict):
+                result[word] = WordInfo(
+                    word=word,
+                    definition=self._extract_definition(entry),
+                    pronunciation=self._extract_pronunciation(entry)
+                )
+
+        if not result:
+            raise DictionaryServiceError("批量查询响应中没有任何请求的单词")
+
+        return result
+
     def _concurrent_batch_lookup(self, words: List[str]) -> Dict[str, WordInfo]:
         """使用并发查询优化批量查询性能
         
@@ -395,60 +685,97 @@ class EasyPronunciationService(BaseDictionaryService):
             return {}
         
         result = {}
-        
-        # 使用线程池并发查询
-        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
-            # 提交所有查询任务
-            future_to_word = {}
-            for word in words:
-                # 检查缓存
+
+        # 提交所有查询任务到常驻线程池
+        future_to_word = {}
+        for word in words:
+            # 检查缓存
+            cache_key = f"batch_{word}"
+            cached_result = self._get_from_cache(cache_key)
+            if cached_result is not None:
+                result[word] = cached_result
+            else:
+                # 提交并发任务
+                future = self._executor.submit(self._lookup_single_word, word)
+                future_to_word[future] = word
+
+        # 收集结果
+        for future in as_completed(future_to_word):
+            word = future_to_word[future]
+            try:
+                word_info = future.result()
+                result[word] = word_info
+
+                # 缓存结果
                 cache_key = f"batch_{word}"
-                cached_result = self._get_from_cache(cache_key)
-                if cached_result is not None:
-                    result[word] = cached_result
-                else:
-                    # 提交并发任务
-                    future = executor.submit(self._lookup_single_word, word)
-                    future_to_word[future] = word
-            
-            # 收集结果
-            for future in as_completed(future_to_word):
-                word = future_to_word[future]
-                try:
-                    word_info = future.result()
-                    result[word] = word_info
-                    
-                    # 缓存结果
-                    cache_key = f"batch_{word}"
-                    self._set_cache(cache_key, word_info)
-                    
-                except Exception as e:
-                    self.logger.warning(f"查询单词'{word}'失败: {str(e)}")
-                    result[word] = WordInfo(
-                        word=word,
-                        definition="",
-                        pronunciation=""
-                    )
-        
+                self._set_cache(cache_key, word_info)
+
+            except Exception as e:
+                self.logger.warning(f"查询单词'{word}'失败: {str(e)}")
+                result[word] = WordInfo(
+                    word=word,
+                    definition="",
+                    pronunciation=""
+                )
+
         return result
     
     def _lookup_single_word(self, word: str) -> WordInfo:
-        """查询单个单词的信息
-        
+        """查询单个单词的信息（合并并发的同词请求）
+
+        两个线程同时查询同一个未缓存的单词时，双方都会缓存未命中
+        并各自发起HTTP请求。登记表保证只有第一个调用方真正执行，
+        后来者直接等待同一个Future的结果。
+
         Args:
             word: 要查询的单词
-            
+
         Returns:
             WordInfo: 单词信息
         """
+        with self._inflight_lock:
+            future = self._inflight.get(word)
+            is_leader = future is None
+            if is_leader:
+                future = Future()
+                self._inflight[word] = future
+
+        if not is_leader:
+            return future.result()
+
         try:
-            definition = self.get_definition(word)
-            pronunciation = self.get_pronunciation(word)
-            
+            word_info = self._do_lookup(word)
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(word_info)
+            return word_info
+        finally:
+            with self._inflight_lock:
+                self._inflight.pop(word, None)
+
+    def _do_lookup(self, word: str) -> WordInfo:
+        """实际执行单个单词的查询
+
+        Args:
+            word: 要查询的单词
+
+        Returns:
+            WordInfo: 单词信息
+        """
+        try:
+            # 两个请求并行发出而非顺序等待：API没有合并端点，
+            # 但释义和音标互不依赖，墙钟时间取两者较慢的一个
+            definition_future = self._pair_executor.submit(
+                self.get_definition, word)
+            pronunciation_future = self._pair_executor.submit(
+                self.get_pronunciation, word)
+
             return WordInfo(
                 word=word,
-                definition=definition,
-                pronunciation=pronunciation
+                definition=definition_future.result(),
+                pronunciation=pronunciation_future.result()
             )
         except Exception as e:
             self.logger.warning(f"查询单词'{word}'失败: {str(e)}")
@@ -464,7 +791,7 @@ class LocalDictionaryService(BaseDictionaryService):
     
     def __init__(self, dictionary_file: Optional[str] = None):
         """初始化本地词典服务
-        
+
         Args:
             dictionary_file: 本地词典文件路径
         """
@@ -472,21 +799,86 @@ class LocalDictionaryService(BaseDictionaryService):
         self.dictionary_file = dictionary_file
         self.logger = logging.getLogger(__name__)
         self._local_dict = {}
+        self._db: Optional[sqlite3.Connection] = None
         self._load_local_dictionary()
-    
+
+        if self._db is not None:
+            # 磁盘索引路径：热词查询结果按实例缓存
+            self._fetch_entry = lru_cache(maxsize=50000)(self._fetch_entry)
+
+        # 扁平条目表：标准化单词直接映射到(释义, 音标)元组，
+        # 一次哈希探测即可取回两个字段，无需内嵌字典的二次查找
+        self._entries = {word: (info.get('definition', ''),
+                                info.get('pronunciation', ''))
+                         for word, info in self._local_dict.items()}
+
     def _load_local_dictionary(self):
-        """加载本地词典数据"""
+        """加载本地词典数据
+
+        提供词典文件时不再把整个JSON载入内存，而是首次使用时
+        转换为旁路SQLite索引（dict.db），之后按主键查询：
+        启动从O(N)降到O(1)，常驻内存只剩页缓存命中的部分。
+        """
         if self.dictionary_file:
             try:
-                with open(self.dictionary_file, 'r', encoding='utf-8') as f:
-                    self._local_dict = json.load(f)
-                self.logger.info(f"加载本地词典: {len(self._local_dict)}个词条")
-            except Exception as e:
+                self._db = self._open_dictionary_index(self.dictionary_file)
+                count = self._db.execute(
+                    "SELECT COUNT(*) FROM words").fetchone()[0]
+                self.logger.info(f"加载本地词典索引: {count}个词条")
+                if count:
+                    return
+                self._db.close()
+                self._db = None
+            except (OSError, sqlite3.Error, json.JSONDecodeError,
+                    AttributeError, TypeError) as e:
                 self.logger.warning(f"加载本地词典失败: {str(e)}")
-        
+                self._db = None
+
         # 如果没有本地词典文件，使用内置的基础词典
         if not self._local_dict:
             self._load_builtin_dictionary()
+
+    @staticmethod
+    def _open_dictionary_index(dictionary_file: str) -> sqlite3.Connection:
+        """打开词典的SQLite索引，缺失或过期时从JSON重建一次"""
+        import os
+
+        db_path = dictionary_file + '.db'
+        json_mtime = os.stat(dictionary_file).st_mtime
+        needs_build = (not os.path.exists(db_path)
+                       or os.stat(db_path).st_mtime < json_mtime)
+
+        conn = sqlite3.connect(db_path, check_same_thread=False)
+        if needs_build:
+            with open(dictionary_file, 'r', encoding='utf-8') as f:
+                entries = json.load(f)
+            conn.execute("DROP TABLE IF EXISTS words")
+            conn.execute(
+                "CREATE TABLE words ("
+                "word TEXT PRIMARY KEY, definition TEXT, pronunciation TEXT)")
+            conn.executemany(
+                "INSERT INTO words VALUES (?, ?, ?)",
+                ((word, info.get('definition', ''),
+                  info.get('pronunciation', ''))
+                 for word, info in entries.items()))
+            conn.commit()
+
+        return conn
+
+    def _fetch_entry(self, normalized: str) -> Optional[tuple]:
+        """从SQLite索引按主键取(释义, 音标)元组"""
+        return self._db.execute(
+            "SELECT definition, pronunciation FROM words WHERE word = ?",
+            (normalized,)).fetchone()
+
+    # 未收录单词的共享空条目
+    _EMPTY_ENTRY = ('', '')
+
+    def _entry(self, normalized: str) -> tuple:
+        """按标准化单词取(释义, 音标)条目，未收录返回空条目"""
+        if self._db is not None:
+            return self._fetch_entry(normalized) or self._EMPTY_ENTRY
+        return self._entries.get(normalized, self._EMPTY_ENTRY)
     
     def _load_builtin_dictionary(self):
         """加载内置基础词典"""
@@ -505,31 +897,35 @@ class LocalDictionaryService(BaseDictionaryService):
         """获取单词的中文释义"""
         if not word:
             return ""
-        
-        word = word.strip().lower()
-        word_info = self._local_dict.get(word, {})
-        return word_info.get('definition', '')
-    
+
+        return self._entry(word.strip().lower())[0]
+
     def get_pronunciation(self, word: str) -> str:
         """获取单词的IPA音标"""
         if not word:
             return ""
-        
-        word = word.strip().lower()
-        word_info = self._local_dict.get(word, {})
-        return word_info.get('pronunciation', '')
-    
+
+        return self._entry(word.strip().lower())[1]
+
     def batch_lookup(self, words: List[str]) -> Dict[str, WordInfo]:
         """批量查询单词信息"""
+        entry_of = self._entry
+
+        # 相同标准化形式的重复单词共享同一个WordInfo对象；
+        # 每个唯一单词只做一次标准化和一次条目探测
+        info_by_norm: Dict[str, WordInfo] = {}
         result = {}
         for word in words:
-            definition = self.get_definition(word)
-            pronunciation = self.get_pronunciation(word)
-            
-            result[word] = WordInfo(
-                word=word,
-                definition=definition,
-                pronunciation=pronunciation
-            )
-        
+            normalized = word.strip().lower() if word else ''
+            info = info_by_norm.get(normalized)
+            if info is None:
+                definition, pronunciation = entry_of(normalized)
+                info = WordInfo(
+                    word=word,
+                    definition=definition,
+                    pronunciation=pronunciation
+                )
+                info_by_norm[normalized] = info
+            result[word] = info
+
         return result
\ No newline at end of file
@@ -4,9 +4,19 @@ PDF处理器实现
 使用pdfplumber库实现PDF文件的验证、文本提取和信息获取功能
 """
 
+import hashlib
+import io
+import itertools
+import math
+import mmap
 import os
+import re
+from concurrent.futures import (FIRST_COMPLETED, ProcessPoolExecutor,
+                                ThreadPoolExecutor, wait)
+from contextlib import contextmanager
+from functools import lru_cache, partial
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Dict, Iterator, List, Optional, Tuple
 import logging
 
 try:
@@ -14,6 +24,11 @@ try:
 except ImportError:
     pdfplumber = None
 
+try:
+    import pypdf
+except ImportError:
+    pypdf = None
+
 from ..core.interfaces import PDFProcessorInterface
 from ..core.models import APIResponse
 
@@ -23,163 +38,759 @@ class PDFProcessorError(Exception):
     pass
 
 
+def _extract_one_page(file_path: str, page_index: int) -> str:
+    """进程池工作函数：在子进程中打开PDF并提取单页文本
+
+    页面解析是纯Python的CPU密集操作，进程并行绕开GIL；
+    模块级函数才能被pickle传给子进程。提取失败返回空串，
+    与串行路径跳过坏页的行为一致。
+    """
+    try:
+        with pdfplumber.open(file_path) as pdf:
+            return pdf.pages[page_index].extract_text() or ""
+    except Exception:
+        return ""
+
+
+def _extract_text_worker(max_file_size_mb: int,
+                         file_path: str) -> Tuple[Optional[str],
+                                                  Optional[str]]:
+    """进程池工作函数：在子进程中提取整个PDF的文本
+
+    每个子进程构造独立的处理器（串行后端，避免嵌套并行），
+    异常以字符串形式带回父进程，不中断其他文件的处理。
+    """
+    try:
+        processor = PDFProcessor(max_file_size_mb=max_file_size_mb,
+                                 extraction_backend='sequential')
+        return processor.extract_text(file_path), None
+    except Exception as e:
+        return None, str(e)
+
+
 class PDFProcessor(PDFProcessorInterface):
     """PDF处理器实现类"""
-    
-    def __init__(self, max_file_size_mb: int = 50):
+
+    # 预编译的单词模式 - 类级常量，避免页面循环内的重复编译/缓存探测
+    _ENGLISH_WORD_RE = re.compile(r"\b[A-Za-z]+\b")
+    _WORD_RE = re.compile(r"\b\w+\b")
+
+    # 文本清理模式：行内空白折叠为单空格；换行连同两侧空白折叠为单换行
+    _INLINE_WS_RE = re.compile(r"[ \t\r\f\v]+")
+    _NEWLINE_RUN_RE = re.compile(r" *\n\s*")
+
+    # 支持的文本提取后端
+    _EXTRACTION_BACKENDS = ('sequential', 'threads', 'processes')
+
+    def __init__(self, max_file_size_mb: int = 50, num_workers: int = 1,
+                 cache_dir: Optional[str] = None,
+                 extraction_backend: str = 'threads'):
         """初始化PDF处理器
-        
+
         Args:
             max_file_size_mb: 允许的最大文件大小（MB）
+            num_workers: 并行提取的工作线程/进程数（1时按CPU数取默认值）
+            cache_dir: 提取文本的磁盘缓存目录
+                       （默认~/.cache/pdf-vocab-extractor/）
+            extraction_backend: 文本提取策略，'sequential'（串行）、
+                                'threads'（线程池，低启动开销）或
+                                'processes'（进程池，绕开GIL）
         """
         if pdfplumber is None:
             raise ImportError("需要安装pdfplumber库: pip install pdfplumber")
-        
+
+        if extraction_backend not in self._EXTRACTION_BACKENDS:
+            raise ValueError(f"未知的文本提取后端: {extraction_backend}")
+
         self.max_file_size_mb = max_file_size_mb
+        self.num_workers = max(1, num_workers)
+        self.extraction_backend = extraction_backend
+        self.cache_dir = (Path(cache_dir) if cache_dir
+                          else Path.home() / '.cache' / 'pdf-vocab-extractor')
         self.logger = logging.getLogger(__name__)
+
+        # 按(路径, mtime_ns, 大小)缓存结构验证结果：文件未修改时
+        # 免去重复的pdfplumber解析+首页提取（键含stat信息，修改即失效）
+        self._validate_structure = lru_cache(maxsize=256)(
+            self._validate_structure
+        )
     
-    def validate_pdf(self, file_path: str) -> bool:
+    def validate_pdf(self, file_path: str, pdf=None) -> bool:
         """验证PDF文件的有效性
-        
+
         Args:
             file_path: PDF文件路径
-            
+            pdf: 已打开的pdfplumber.PDF对象（可选，复用句柄避免重复解析）
+
         Returns:
             bool: 文件是否有效
         """
         try:
-            # 检查文件是否存在
-            if not Path(file_path).exists():
-                self.logger.error(f"文件不存在: {file_path}")
+            stat_result = self._validate_path(file_path)
+            if stat_result is None:
                 return False
-            
-            # 检查文件扩展名
-            if not file_path.lower().endswith('.pdf'):
-                self.logger.error(f"不是PDF文件: {file_path}")
-                return False
-            
-            # 检查文件大小
-            file_size_mb = Path(file_path).stat().st_size / (1024 * 1024)
-            if file_size_mb > self.max_file_size_mb:
-                self.logger.error(f"文件过大: {file_size_mb:.1f}MB > {self.max_file_size_mb}MB")
+
+            # 结构验证：优先复用调用方已打开的句柄
+            if pdf is not None:
+                return self._validate_open_pdf(file_path, pdf)
+
+            # 廉价的trailer预检：明显截断的文件免去完整解析
+            if self._quick_pdf_sniff(file_path, stat_result.st_size) is False:
                 return False
-            
-            # 尝试打开PDF文件
-            with pdfplumber.open(file_path) as pdf:
-                # 检查是否有页面
-                if len(pdf.pages) == 0:
-                    self.logger.error(f"PDF文件没有页面: {file_path}")
-                    return False
-                
-                # 尝试读取第一页（验证文件完整性）
-                first_page = pdf.pages[0]
-                _ = first_page.extract_text()
-            
-            return True
-            
+
+            return self._validate_structure(
+                file_path, stat_result.st_mtime_ns, stat_result.st_size)
+
         except Exception as e:
             self.logger.error(f"PDF验证失败 {file_path}: {str(e)}")
             return False
+
+    def _validate_path(self, file_path: str) -> Optional[os.stat_result]:
+        """路径级验证（存在性、扩展名、大小），不打开PDF
+
+        Args:
+            file_path: PDF文件路径
+
+        Returns:
+            Optional[os.stat_result]: 通过时返回stat结果供复用，否则None
+        """
+        # 单次stat同时充当存在性检查（缺失时抛出异常），
+        # 省去exists()的额外系统调用
+        try:
+            stat_result = Path(file_path).stat()
+        except OSError:
+            self.logger.error(f"文件不存在: {file_path}")
+            return None
+
+        # 检查文件扩展名
+        if not file_path.lower().endswith('.pdf'):
+            self.logger.error(f"不是PDF文件: {file_path}")
+            return None
+
+        # 检查文件大小
+        file_size_mb = stat_result.st_size / (1024 * 1024)
+        if file_size_mb > self.max_file_size_mb:
+            self.logger.error(f"文件过大: {file_size_mb:.1f}MB > {self.max_file_size_mb}MB")
+            return None
+
+        return stat_result
+
+    def _quick_pdf_sniff(self, file_path: str,
+                         file_size: int) -> Optional[bool]:
+        """廉价的文件头/trailer预检，不解析文档即可识别明显坏文件
+
+        只读取文件头5字节和末尾约2KB：带%PDF头但trailer窗口缺少
+        %%EOF或startxref的文件视为截断，直接判定无效。其他情况
+        （包括出现/Encrypt的加密标记——空口令文档pdfplumber仍可
+        打开）一律返回None，交给完整解析裁决，避免误杀非标准文件。
+
+        Args:
+            file_path: PDF文件路径
+            file_size: 文件大小（复用已有的stat结果）
+
+        Returns:
+            Optional[bool]: False=确定无效；None=无法断定
+        """
+        try:
+            with open(file_path, 'rb') as f:
+                if f.read(5) != b'%PDF-':
+                    return None
+                f.seek(max(0, file_size - 2048))
+                trailer = f.read()
+        except OSError:
+            return None
+
+        if b'%%EOF' not in trailer or b'startxref' not in trailer:
+            self.logger.error(
+                f"PDF尾部缺少%%EOF/startxref标记（文件可能截断）: {file_path}")
+            return False
+
+        return None
+
+    def _validate_structure(self, file_path: str, mtime_ns: int,
+                            size: int) -> bool:
+        """打开PDF执行结构验证（结果按stat键缓存，见__init__）"""
+        with self._open_pdf(file_path) as opened_pdf:
+            return self._validate_open_pdf(file_path, opened_pdf)
+
+    @contextmanager
+    def _open_validated(self, file_path: str):
+        """打开并验证PDF的统一上下文管理器
+
+        路径级检查（存在性/扩展名/大小）失败或结构验证失败都抛出
+        PDFProcessorError；结构验证复用刚打开的句柄，每次公开调用
+        只打开文档一次。
+
+        Yields:
+            已通过验证的pdfplumber.PDF对象
+
+        Raises:
+            PDFProcessorError: PDF文件验证失败
+        """
+        # 路径级验证失败时无须打开文档
+        if self._validate_path(file_path) is None:
+            raise PDFProcessorError(f"PDF文件验证失败: {file_path}")
+
+        with self._open_pdf(file_path) as pdf:
+            # 复用同一句柄完成结构验证，避免二次解析文档
+            if not self.validate_pdf(file_path, pdf=pdf):
+                raise PDFProcessorError(f"PDF文件验证失败: {file_path}")
+            yield pdf
+
+    @contextmanager
+    def _open_pdf(self, file_path: str):
+        """以内存缓冲方式打开PDF的上下文管理器
+
+        pdfminer在文件句柄上做小块缓冲读取，逐页seek开销明显；
+        大小已受max_file_size_mb约束，整个文件经mmap一次读入
+        BytesIO后解析全程走内存。mmap不可用（空文件等）时退回
+        按路径直接打开。
+        """
+        buffer = None
+        try:
+            with open(file_path, 'rb') as f:
+                with mmap.mmap(f.fileno(), 0,
+                               access=mmap.ACCESS_READ) as mm:
+                    buffer = io.BytesIO(mm)
+        except (OSError, ValueError) as e:
+            self.logger.debug(f"内存映射打开失败，退回文件句柄: {str(e)}")
+
+        if buffer is None:
+            with pdfplumber.open(file_path) as pdf:
+                yield pdf
+        else:
+            with pdfplumber.open(buffer) as pdf:
+                yield pdf
+
+    @staticmethod
+    def _fast_page_count(pdf) -> int:
+        """从页面树直接读取页数，避免len(pdf.pages)物化所有页面对象
+
+        pdfplumber的pages属性会为每一页解析页面字典；只需要数量时
+        直接取trailer中Pages节点的Count。读取失败或结果异常时退回
+        len(pdf.pages)。
+        """
+        try:
+            count = pdf.doc.catalog["Pages"].resolve()["Count"]
+            if isinstance(count, int) and count >= 0:
+                return count
+        except Exception:
+            pass
+        return len(pdf.pages)
+
+    def _validate_open_pdf(self, file_path: str, pdf) -> bool:
+        """在已打开的PDF句柄上执行结构验证"""
+        # 检查是否有页面
+        if self._fast_page_count(pdf) == 0:
+            self.logger.error(f"PDF文件没有页面: {file_path}")
+            return False
+
+        # 尝试读取第一页（验证文件完整性）
+        first_page = pdf.pages[0]
+        _ = first_page.extract_text()
+
+        return True
     
-    def extract_text(self, file_path: str) -> str:
+    def extract_text(self, file_path: str, force_refresh: bool = False) -> str:
         """从PDF中提取文本内容
-        
+
         Args:
             file_path: PDF文件路径
-            
+            force_refresh: 忽略磁盘缓存强制重新提取
+
         Returns:
             str: 提取的文本内容
-            
+
         Raises:
             PDFProcessorError: PDF处理错误
             FileNotFoundError: 文件不存在
         """
-        if not self.validate_pdf(file_path):
-            raise PDFProcessorError(f"PDF文件验证失败: {file_path}")
-        
         try:
-            extracted_text = []
-            
-            with pdfplumber.open(file_path) as pdf:
-                total_pages = len(pdf.pages)
+            # 磁盘缓存按(路径, mtime_ns, 大小)寻址：文件未变时跳过整个解析
+            cache_file = self._text_cache_path(file_path)
+            if cache_file is not None and not force_refresh:
+                try:
+                    if cache_file.exists():
+                        self.logger.debug(f"命中文本缓存: {cache_file.name}")
+                        return cache_file.read_text(encoding='utf-8')
+                except OSError as e:
+                    self.logger.warning(f"读取文本缓存失败: {str(e)}")
+
+            extracted_text = None
+
+            with self._open_validated(file_path) as pdf:
+                total_pages = self._fast_page_count(pdf)
                 self.logger.info(f"开始提取PDF文本，共{total_pages}页")
-                
-                for page_num, page in enumerate(pdf.pages, 1):
-                    try:
-                        # 提取页面文本
-                        page_text = page.extract_text()
-                        
-                        if page_text:
-                            # 清理文本（移除多余空白字符）
-                            cleaned_text = self._clean_text(page_text)
-                            extracted_text.append(cleaned_text)
-                            
-                        self.logger.debug(f"第{page_num}/{total_pages}页文本提取完成")
-                        
-                    except Exception as e:
-                        self.logger.warning(f"第{page_num}页文本提取失败: {str(e)}")
-                        continue
-            
+
+                if (self.extraction_backend == 'threads'
+                        and total_pages > 1):
+                    # 线程池共享已打开的句柄；map保持页序
+                    page_texts = self._extract_pages_threaded(
+                        pdf, total_pages)
+                    extracted_text = [self._clean_text(text)
+                                      for text in page_texts if text]
+                elif (self.extraction_backend == 'sequential'
+                        or total_pages <= 1):
+                    extracted_text = []
+                    for page_num, page in enumerate(pdf.pages, 1):
+                        try:
+                            # 提取页面文本
+                            page_text = page.extract_text()
+
+                            if page_text:
+                                # 清理文本（移除多余空白字符）
+                                cleaned_text = self._clean_text(page_text)
+                                extracted_text.append(cleaned_text)
+
+                            self.logger.debug(f"第{page_num}/{total_pages}页文本提取完成")
+
+                        except Exception as e:
+                            self.logger.warning(f"第{page_num}页文本提取失败: {str(e)}")
+                            continue
+
+            if extracted_text is None:
+                # 多进程路径在句柄关闭后启动：每个子进程自行打开文件
+                page_texts = self._extract_pages_parallel(file_path, total_pages)
+                extracted_text = [self._clean_text(text)
+                                  for text in page_texts if text]
+
             full_text = "\n".join(extracted_text)
             
             if not full_text.strip():
                 raise PDFProcessorError("PDF文件中未找到可提取的文本内容")
-            
+
+            if cache_file is not None:
+                self._write_text_cache(cache_file, full_text)
+
             self.logger.info(f"文本提取完成，共{len(full_text)}个字符")
             return full_text
-            
-        except pdfplumber.pdfplumber.PDFSyntaxError as e:
-            raise PDFProcessorError(f"PDF文件格式错误: {str(e)}")
+
+        except PDFProcessorError:
+            raise
         except Exception as e:
             raise PDFProcessorError(f"文本提取失败: {str(e)}")
-    
-    def get_pdf_info(self, file_path: str) -> Dict:
+
+    def _text_cache_path(self, file_path: str) -> Optional[Path]:
+        """计算文件在文本缓存中的路径（文件不可stat时返回None）"""
+        try:
+            stat_result = os.stat(file_path)
+        except OSError:
+            return None
+
+        key = (f"{Path(file_path).resolve()}|"
+               f"{stat_result.st_mtime_ns}|{stat_result.st_size}")
+        digest = hashlib.md5(key.encode('utf-8')).hexdigest()
+        return self.cache_dir / f"{digest}.txt"
+
+    def _write_text_cache(self, cache_file: Path, text: str) -> None:
+        """原子写入文本缓存（失败只记录警告，不影响提取结果）"""
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            tmp_file = cache_file.with_name(
+                f"{cache_file.name}.{os.getpid()}.tmp")
+            tmp_file.write_text(text, encoding='utf-8')
+            os.replace(tmp_file, cache_file)
+        except OSError as e:
+            self.logger.warning(f"写入文本缓存失败: {str(e)}")
+
+    def extract_texts(self, file_paths: List[str],
+                      max_workers: Optional[int] = None
+                      ) -> Tuple[Dict[str, str], Dict[str, str]]:
+        """并行提取多个PDF的文本（按文件分发到进程池）
+
+        文件级并行没有任何跨工作者的共享状态，PDF语料的处理
+        天然是"易并行"负载。单个文件失败只记入错误字典，
+        不影响其余文件。
+
+        Args:
+            file_paths: PDF文件路径列表
+            max_workers: 工作进程数（默认按CPU数和文件数取小）
+
+        Returns:
+            Tuple[Dict, Dict]: (路径->文本, 路径->错误信息)
+        """
+        if not file_paths:
+            return {}, {}
+
+        workers = max_workers or min(os.cpu_count() or 1, len(file_paths))
+        worker = partial(_extract_text_worker, self.max_file_size_mb)
+
+        texts: Dict[str, str] = {}
+        errors: Dict[str, str] = {}
+
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            # chunksize=1：单文件耗时方差大，细粒度分发利于负载均衡
+            for file_path, (text, error) in zip(
+                    file_paths,
+                    executor.map(worker, file_paths, chunksize=1)):
+                if error is None:
+                    texts[file_path] = text
+                else:
+                    errors[file_path] = error
+                    self.logger.warning(f"提取失败 {file_path}: {error}")
+
+        self.logger.info(
+            f"批量提取完成：{len(texts)}个成功，{len(errors)}个失败")
+        return texts, errors
+
+    def extract_texts_bounded(self, file_paths: List[str],
+                              max_inflight: int = 10,
+                              max_workers: Optional[int] = None
+                              ) -> Tuple[Dict[str, str], Dict[str, str]]:
+        """有界并发的批量文本提取（带背压，防止结果堆积耗尽内存）
+
+        extract_texts的map会为全部文件提前排队，大语料下每个未
+        消费的结果都缓冲着整篇文档的文本。这里最多保持max_inflight
+        个任务在途：每收割一个完成的任务再提交下一个文件。
+
+        Args:
+            file_paths: PDF文件路径列表
+            max_inflight: 同时在途的最大任务数
+            max_workers: 工作进程数（默认按CPU数和在途上限取小）
+
+        Returns:
+            Tuple[Dict, Dict]: (路径->文本, 路径->错误信息)
+        """
+        if not file_paths:
+            return {}, {}
+
+        max_inflight = max(1, max_inflight)
+        workers = max_workers or min(os.cpu_count() or 1, max_inflight)
+        worker = partial(_extract_text_worker, self.max_file_size_mb)
+
+        texts: Dict[str, str] = {}
+        errors: Dict[str, str] = {}
+        path_iter = iter(file_paths)
+
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            pending = {}
+            for file_path in itertools.islice(path_iter, max_inflight):
+                pending[executor.submit(worker, file_path)] = file_path
+
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    file_path = pending.pop(future)
+                    text, error = future.result()
+                    if error is None:
+                        texts[file_path] = text
+                    else:
+                        errors[file_path] = error
+                        self.logger.warning(f"提取失败 {file_path}: {error}")
+
+                    # 收割一个，补提交一个，保持在途数量恒定
+                    next_path = next(path_iter, None)
+                    if next_path is not None:
+                        pending[executor.submit(worker, next_path)] = next_path
+
+        self.logger.info(
+            f"批量提取完成：{len(texts)}个成功，{len(errors)}个失败")
+        return texts, errors
+
+    def iter_pages_text(self, file_path: str) -> Iterator[str]:
+        """逐页惰性产出清理后的文本
+
+        extract_text的流式版本：不积累整篇文档的字符串列表，
+        峰值内存从O(全文字符数)降到O(单页字符数)，供下游
+        按页消费大文档时使用。
+
+        Args:
+            file_path: PDF文件路径
+
+        Yields:
+            str: 每页清理后的文本（无文本的页面跳过）
+
+        Raises:
+            PDFProcessorError: PDF文件验证失败
+        """
+        with self._open_validated(file_path) as pdf:
+            for page_num, page in enumerate(pdf.pages, 1):
+                try:
+                    page_text = page.extract_text()
+                except Exception as e:
+                    self.logger.warning(f"第{page_num}页文本提取失败: {str(e)}")
+                    continue
+
+                if page_text:
+                    yield self._clean_text(page_text)
+
+    def extract_text_to_file(self, file_path: str, out_path: str) -> int:
+        """流式提取文本并逐页写入目标文件
+
+        每页产出后立即落盘，全程不在内存中物化完整文档。
+
+        Args:
+            file_path: PDF文件路径
+            out_path: 输出文本文件路径
+
+        Returns:
+            int: 写入的字符总数
+
+        Raises:
+            PDFProcessorError: PDF处理错误或无可提取文本
+        """
+        total_chars = 0
+
+        with open(out_path, 'w', encoding='utf-8') as out:
+            for page_index, page_text in enumerate(
+                    self.iter_pages_text(file_path)):
+                if page_index > 0:
+                    out.write('\n')
+                    total_chars += 1
+                out.write(page_text)
+                total_chars += len(page_text)
+
+        if total_chars == 0:
+            raise PDFProcessorError("PDF文件中未找到可提取的文本内容")
+
+        self.logger.info(f"文本提取完成，共{total_chars}个字符写入{out_path}")
+        return total_chars
+
+    def _pool_size(self, total_pages: int) -> int:
+        """计算并行提取的工作者数量（num_workers为1时按CPU数取默认）"""
+        configured = (self.num_workers if self.num_workers > 1
+                      else (os.cpu_count() or 1))
+        return min(configured, os.cpu_count() or 1, 8, total_pages)
+
+    @staticmethod
+    def _extract_page_text_safe(page) -> str:
+        """提取单页文本，失败返回空串（与串行路径跳过坏页一致）"""
+        try:
+            return page.extract_text() or ""
+        except Exception:
+            return ""
+
+    def _extract_pages_threaded(self, pdf, total_pages: int) -> List[str]:
+        """用线程池并行提取已打开PDF的各页文本（保持页序）
+
+        pdfminer解析中的zlib解压等C调用会释放GIL，线程池对
+        中小文档比进程池启动开销低得多，且可直接共享句柄。
+
+        Args:
+            pdf: 已打开的pdfplumber.PDF对象
+            total_pages: 总页数
+
+        Returns:
+            List[str]: 各页原始文本（与页序一致）
+        """
+        with ThreadPoolExecutor(
+                max_workers=self._pool_size(total_pages)) as executor:
+            return list(executor.map(
+                self._extract_page_text_safe, pdf.pages))
+
+    def _extract_pages_parallel(self, file_path: str,
+                                total_pages: int) -> List[str]:
+        """用进程池按页并行提取文本（保持页序）
+
+        Args:
+            file_path: PDF文件路径
+            total_pages: 总页数
+
+        Returns:
+            List[str]: 各页原始文本（与页序一致）
+        """
+        workers = self._pool_size(total_pages)
+        # 较大的chunksize摊销任务分发开销
+        chunksize = max(1, total_pages // (4 * workers))
+
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(
+                partial(_extract_one_page, file_path),
+                range(total_pages),
+                chunksize=chunksize))
+
+    def get_pdf_metadata_only(self, file_path: str) -> Dict:
+        """只读取PDF元数据，跳过页面内容解析
+
+        只需要标题/作者/页数的调用方无须支付整篇文档的解析成本：
+        优先用pypdf（strict=False，仅解析trailer和页面树计数，
+        不实例化各页），未安装时退回pdfplumber但只读元数据。
+
+        Args:
+            file_path: PDF文件路径
+
+        Returns:
+            Dict: 元数据信息（total_pages、title、author等）
+
+        Raises:
+            PDFProcessorError: PDF处理错误
+        """
+        try:
+            file_path_obj = Path(file_path)
+            stat = file_path_obj.stat()
+
+            info = {
+                'file_name': file_path_obj.name,
+                'file_path': str(file_path_obj.absolute()),
+                'file_size_mb': round(stat.st_size / (1024 * 1024), 2),
+                'file_size_bytes': stat.st_size,
+                'total_pages': 0,
+                'title': '',
+                'author': '',
+                'creator': '',
+                'producer': '',
+                'is_encrypted': False,
+                'created_time': stat.st_ctime,
+                'modified_time': stat.st_mtime
+            }
+
+            if pypdf is not None:
+                reader = pypdf.PdfReader(file_path, strict=False)
+                info['is_encrypted'] = bool(reader.is_encrypted)
+                if not reader.is_encrypted:
+                    info['total_pages'] = len(reader.pages)
+                    metadata = reader.metadata
+                    if metadata:
+                        info.update({
+                            'title': (metadata.title or '').strip(),
+                            'author': (metadata.author or '').strip(),
+                            'creator': (metadata.creator or '').strip(),
+                            'producer': (metadata.producer or '').strip()
+                        })
+                return info
+
+            # pypdf未安装时退回pdfplumber：仍跳过页面文本提取
+            with self._open_pdf(file_path) as pdf:
+                info['total_pages'] = len(pdf.pages)
+                try:
+                    info['is_encrypted'] = hasattr(pdf, 'is_encrypted') and pdf.is_encrypted
+                except:
+                    pass
+                if hasattr(pdf, 'metadata') and pdf.metadata:
+                    metadata = pdf.metadata
+                    info.update({
+                        'title': metadata.get('Title', '').strip(),
+                        'author': metadata.get('Author', '').strip(),
+                        'creator': metadata.get('Creator', '').strip(),
+                        'producer': metadata.get('Producer', '').strip()
+                    })
+
+            return info
+
+        except Exception as e:
+            raise PDFProcessorError(f"获取PDF元数据失败: {str(e)}")
+
+    def get_pdf_info(self, file_path: str, deep: bool = True) -> Dict:
         """获取PDF文件信息
-        
+
         Args:
             file_path: PDF文件路径
-            
+            deep: 是否执行页面内容分析（False时只返回元数据）
+
         Returns:
             Dict: PDF文件信息
         """
-        if not self.validate_pdf(file_path):
-            raise PDFProcessorError(f"PDF文件验证失败: {file_path}")
-        
+        if not deep:
+            return self.get_pdf_metadata_only(file_path)
+
         try:
-            file_path_obj = Path(file_path)
-            
-            with pdfplumber.open(file_path) as pdf:
-                # 基础文件信息
+            return self.inspect_pdf(file_path, want=('info',))['info']
+        except Exception as e:
+            raise PDFProcessorError(f"获取PDF信息失败: {str(e)}")
+
+    @staticmethod
+    def _empty_health_report() -> Dict:
+        """健康检查结果的默认骨架"""
+        return {
+            'is_healthy': True,
+            'issues': [],
+            'warnings': [],
+            'is_readable': True,
+            'is_encrypted': False,
+            'has_corrupted_pages': False,
+            'total_pages': 0,
+            'readable_pages': 0
+        }
+
+    @staticmethod
+    def _empty_structure_report() -> Dict:
+        """结构分析结果的默认骨架"""
+        return {
+            'total_pages': 0,
+            'has_text': False,
+            'has_images': False,
+            'has_tables': False,
+            'text_density': 0.0,  # 文本密度（字符数/页面数）
+            'avg_words_per_page': 0,
+            'page_sizes': [],
+            'content_distribution': {
+                'text_pages': 0,
+                'image_pages': 0,
+                'mixed_pages': 0,
+                'empty_pages': 0
+            }
+        }
+
+    @staticmethod
+    def _sample_page_indices(total_pages: int) -> List[int]:
+        """选取跨越全文的采样页索引（约sqrt(总页数)个，5~15之间）
+
+        固定采样前5页会偏向标题页/目录，对正文密度的外推偏差大；
+        等距分布的采样以相同的解析成本得到更有代表性的平均值。
+        小文档（25页以内）仍覆盖约5页。
+        """
+        if total_pages <= 0:
+            return []
+
+        k = min(max(5, int(math.sqrt(total_pages))), 15)
+        return sorted({int(i * total_pages / k) for i in range(k)})
+
+    def inspect_pdf(self, file_path: str,
+                    want=('info', 'health', 'structure')) -> Dict:
+        """单次遍历生成信息/健康/结构检查结果
+
+        三类检查的主要成本都是逐页的extract_text调用；分开执行时
+        需要多种视图的调用方要付数倍的解析费。这里打开文档一次、
+        每页只提取一次文本，在同一循环体内更新所有被请求视图的
+        计数器。只请求'info'时仍然只采样前几页。
+
+        Args:
+            file_path: PDF文件路径
+            want: 需要生成的视图（'info'/'health'/'structure'组合）
+
+        Returns:
+            Dict: 以视图名为键的结果字典
+
+        Raises:
+            PDFProcessorError: PDF文件验证失败
+        """
+        wanted = set(want)
+        health = self._empty_health_report() if 'health' in wanted else None
+        structure = (self._empty_structure_report()
+                     if 'structure' in wanted else None)
+        info = None
+
+        with self._open_validated(file_path) as pdf:
+            total_pages = self._fast_page_count(pdf)
+
+            # 加密状态（info与health共用）
+            try:
+                is_encrypted = hasattr(pdf, 'is_encrypted') and pdf.is_encrypted
+            except:
+                is_encrypted = False
+
+            if 'info' in wanted:
+                file_path_obj = Path(file_path)
+                stat = file_path_obj.stat()
                 info = {
                     'file_name': file_path_obj.name,
                     'file_path': str(file_path_obj.absolute()),
-                    'file_size_mb': round(file_path_obj.stat().st_size / (1024 * 1024), 2),
-                    'file_size_bytes': file_path_obj.stat().st_size,
-                    'total_pages': len(pdf.pages),
+                    'file_size_mb': round(stat.st_size / (1024 * 1024), 2),
+                    'file_size_bytes': stat.st_size,
+                    'total_pages': total_pages,
                     'has_text': False,
                     'estimated_words': 0,
                     'estimated_english_words': 0,
-                    'created_time': None,
-                    'modified_time': None,
-                    'is_encrypted': False,
+                    'created_time': stat.st_ctime,
+                    'modified_time': stat.st_mtime,
+                    'is_encrypted': is_encrypted,
                     'is_corrupted': False,
                     'pages_with_text': 0,
                     'pages_with_images': 0,
                     'content_preview': "",
                     'language_detected': "unknown"
                 }
-                
-                # 文件时间信息
-                stat = file_path_obj.stat()
-                info['created_time'] = stat.st_ctime
-                info['modified_time'] = stat.st_mtime
-                
-                # 检查PDF是否加密
-                try:
-                    info['is_encrypted'] = hasattr(pdf, 'is_encrypted') and pdf.is_encrypted
-                except:
-                    info['is_encrypted'] = False
-                
+
                 # PDF元数据
                 if hasattr(pdf, 'metadata') and pdf.metadata:
                     metadata = pdf.metadata
@@ -193,76 +804,214 @@ class PDFProcessor(PDFProcessorInterface):
                         'modification_date': metadata.get('ModDate', ''),
                         'keywords': metadata.get('Keywords', '').strip()
                     })
-                
-                # 详细分析页面内容
-                total_chars = 0
-                english_word_count = 0
-                pages_with_text = 0
-                pages_with_images = 0
-                content_samples = []
-                
-                # 分析前几页或所有页面（如果页数较少）
-                pages_to_analyze = min(5, len(pdf.pages))
-                
-                for i in range(pages_to_analyze):
-                    try:
-                        page = pdf.pages[i]
+
+            if health is not None:
+                health['total_pages'] = total_pages
+                if is_encrypted:
+                    health['is_encrypted'] = True
+                    health['warnings'].append("PDF文件已加密")
+
+            if structure is not None:
+                structure['total_pages'] = total_pages
+
+            # 遍历范围：health/structure需要全量页面；info只采样
+            # 跨越全文的等距页面（而非固定前5页）
+            sample_indices = self._sample_page_indices(total_pages)
+            sample_set = set(sample_indices)
+            sample_count = len(sample_indices)
+            scan_all = health is not None or structure is not None
+
+            if scan_all:
+                page_iter = enumerate(pdf.pages)
+            else:
+                page_iter = ((i, pdf.pages[i]) for i in sample_indices)
+
+            # info采样统计
+            total_chars = 0
+            english_word_count = 0
+            non_ascii_count = 0
+            info_pages_with_text = 0
+            info_pages_with_images = 0
+            content_samples = []
+
+            # health统计
+            readable_pages = 0
+            corrupted_pages = []
+
+            # structure统计
+            total_text_chars = 0
+            total_words = 0
+            structure_text_parts = []
+
+            for i, page in page_iter:
+                # 只有info采样页和structure视图需要付全文提取的成本
+                need_text = (structure is not None
+                             or (info is not None and i in sample_set))
+                try:
+                    if need_text:
+                        # 每页文本只提取一次，供所有视图共享
                         page_text = page.extract_text()
-                        
-                        # 检查文本内容
-                        if page_text and page_text.strip():
-                            pages_with_text += 1
+                    else:
+                        page_text = None
+                        if health is not None:
+                            # 廉价损坏探测：访问mediabox/页面尺寸即可
+                            # 触发页面解析错误，比全文提取便宜得多
+                            _ = page.mediabox
+                            _ = page.width, page.height
+                            readable_pages += 1
+
+                    if structure is not None:
+                        if hasattr(page, 'width') and hasattr(page, 'height'):
+                            structure['page_sizes'].append({
+                                'page': i + 1,
+                                'width': page.width,
+                                'height': page.height
+                            })
+                    elif health is not None and need_text:
+                        # 健康检查仍需访问页面尺寸以探测损坏页
+                        _ = page.width, page.height
+
+                    has_page_text = bool(page_text and page_text.strip())
+                    has_page_images = bool(hasattr(page, 'images')
+                                           and page.images)
+
+                    if health is not None and page_text is not None:
+                        readable_pages += 1
+
+                    if info is not None and i in sample_set:
+                        if has_page_text:
+                            info_pages_with_text += 1
                             page_text_clean = page_text.strip()
                             total_chars += len(page_text_clean)
-                            
+
+                            # 非ASCII字符计数：encode在C层单次完成，
+                            # 替代逐字符的ord()循环
+                            non_ascii_count += (
+                                len(page_text)
+                                - len(page_text.encode('ascii', 'ignore')))
+
                             # 收集内容样本（用于预览）
                             if len(content_samples) < 3:
-                                # 获取页面前200个字符作为预览
                                 sample = page_text_clean[:200].replace('\n', ' ')
                                 content_samples.append(f"Page {i+1}: {sample}...")
-                            
-                            # 估算英语单词数
-                            import re
-                            english_words = re.findall(r'\b[A-Za-z]+\b', page_text)
-                            english_word_count += len(english_words)
-                        
-                        # 检查图片内容
-                        if hasattr(page, 'images') and page.images:
-                            pages_with_images += 1
-                            
-                    except Exception as e:
-                        self.logger.warning(f"分析第{i+1}页时出错: {str(e)}")
-                        continue
-                
-                # 更新统计信息
-                if total_chars > 0:
-                    info['has_text'] = True
-                    info['pages_with_text'] = pages_with_text
-                    info['pages_with_images'] = pages_with_images
-                    
-                    # 基于分析页面估算总单词数
-                    if pages_to_analyze > 0:
-                        avg_chars_per_page = total_chars / pages_to_analyze
-                        avg_english_words_per_page = english_word_count / pages_to_analyze
-                        
-                        info['estimated_words'] = int((avg_chars_per_page * len(pdf.pages)) / 5)
-                        info['estimated_english_words'] = int(avg_english_words_per_page * len(pdf.pages))
-                    
-                    # 生成内容预览
-                    info['content_preview'] = " | ".join(content_samples)
-                    
-                    # 简单的语言检测
-                    if english_word_count > total_chars * 0.1:  # 如果英语单词占比较高
-                        info['language_detected'] = "english"
-                    elif any(ord(char) > 127 for char in page_text[:500]):  # 包含非ASCII字符
-                        info['language_detected'] = "mixed"
-                    else:
-                        info['language_detected'] = "unknown"
-                
-                return info
-                
-        except Exception as e:
-            raise PDFProcessorError(f"获取PDF信息失败: {str(e)}")
+
+                            # 估算英语单词数（finditer计数，不物化列表）
+                            english_word_count += sum(
+                                1 for _ in
+                                self._ENGLISH_WORD_RE.finditer(page_text))
+
+                        if has_page_images:
+                            info_pages_with_images += 1
+
+                    if structure is not None:
+                        # 表格分析（简单检测）
+                        if hasattr(page, 'extract_tables'):
+                            try:
+                                if page.extract_tables():
+                                    structure['has_tables'] = True
+                            except:
+                                pass
+
+                        if has_page_text:
+                            structure['has_text'] = True
+                            total_text_chars += len(page_text.strip())
+                            # 原文暂存，循环后单次正则扫描统计单词数
+                            structure_text_parts.append(page_text)
+
+                        if has_page_images:
+                            structure['has_images'] = True
+
+                        # 页面内容分类
+                        if has_page_text and has_page_images:
+                            structure['content_distribution']['mixed_pages'] += 1
+                        elif has_page_text:
+                            structure['content_distribution']['text_pages'] += 1
+                        elif has_page_images:
+                            structure['content_distribution']['image_pages'] += 1
+                        else:
+                            structure['content_distribution']['empty_pages'] += 1
+
+                except Exception as e:
+                    self.logger.warning(f"分析第{i+1}页时出错: {str(e)}")
+                    if health is not None:
+                        # 廉价探测报错时升级到全文提取，取更具体的错误信息
+                        error = e
+                        if not need_text:
+                            try:
+                                page.extract_text()
+                            except Exception as deeper:
+                                error = deeper
+                        corrupted_pages.append(i + 1)
+                        health['issues'].append(f"第{i + 1}页损坏: {str(error)}")
+                    if structure is not None:
+                        structure['content_distribution']['empty_pages'] += 1
+                    continue
+
+            # info视图汇总
+            if info is not None and total_chars > 0:
+                info['has_text'] = True
+                info['pages_with_text'] = info_pages_with_text
+                info['pages_with_images'] = info_pages_with_images
+
+                # 基于采样页面估算总单词数
+                if sample_count > 0:
+                    avg_chars_per_page = total_chars / sample_count
+                    avg_english_words_per_page = (english_word_count
+                                                  / sample_count)
+                    info['estimated_words'] = int(
+                        (avg_chars_per_page * total_pages) / 5)
+                    info['estimated_english_words'] = int(
+                        avg_english_words_per_page * total_pages)
+
+                # 生成内容预览
+                info['content_preview'] = " | ".join(content_samples)
+
+                # 简单的语言检测：统计覆盖全部采样页面
+                # （原实现只看循环泄漏的最后一页文本前500字符）
+                if english_word_count > total_chars * 0.1:  # 英语单词占比较高
+                    info['language_detected'] = "english"
+                elif non_ascii_count > 0:
+                    info['language_detected'] = "mixed"
+                else:
+                    info['language_detected'] = "unknown"
+
+            # health视图汇总
+            if health is not None:
+                health['readable_pages'] = readable_pages
+
+                if corrupted_pages:
+                    health['has_corrupted_pages'] = True
+                    health['warnings'].append(
+                        f"发现{len(corrupted_pages)}个损坏页面: {corrupted_pages}")
+
+                if readable_pages == 0:
+                    health['is_readable'] = False
+                    health['issues'].append("无法从任何页面提取内容")
+                elif readable_pages < total_pages * 0.5:
+                    health['warnings'].append("超过50%的页面无法正常读取")
+
+                if len(health['issues']) > 0:
+                    health['is_healthy'] = False
+
+            # structure视图汇总
+            if structure is not None and total_pages > 0:
+                # 对拼接后的全文做单次C级正则扫描，
+                # 替代逐页N次的小扫描（单词计数不跨页，\n分隔保持边界）
+                if structure_text_parts:
+                    total_words = sum(1 for _ in self._WORD_RE.finditer(
+                        "\n".join(structure_text_parts)))
+
+                structure['text_density'] = total_text_chars / total_pages
+                structure['avg_words_per_page'] = total_words / total_pages
+
+        results = {}
+        if info is not None:
+            results['info'] = info
+        if health is not None:
+            results['health'] = health
+        if structure is not None:
+            results['structure'] = structure
+        return results
     
     def _clean_text(self, text: str) -> str:
         """清理提取的文本
@@ -275,15 +1024,12 @@ class PDFProcessor(PDFProcessorInterface):
         """
         if not text:
             return ""
-        
-        # 移除多余的空白字符
-        lines = []
-        for line in text.split('\n'):
-            cleaned_line = ' '.join(line.split())  # 移除多余空格
-            if cleaned_line:  # 跳过空行
-                lines.append(cleaned_line)
-        
-        return '\n'.join(lines)
+
+        # 两次C级正则替换完成整页清理，替代逐行split/join的Python循环：
+        # 先折叠行内空白，再把换行连同两侧空白（含空行）折叠为单换行
+        cleaned = self._INLINE_WS_RE.sub(' ', text)
+        cleaned = self._NEWLINE_RUN_RE.sub('\n', cleaned)
+        return cleaned.strip()
     
     def extract_text_with_progress(self, file_path: str, progress_callback=None) -> str:
         """带进度回调的文本提取
@@ -295,15 +1041,12 @@ class PDFProcessor(PDFProcessorInterface):
         Returns:
             str: 提取的文本内容
         """
-        if not self.validate_pdf(file_path):
-            raise PDFProcessorError(f"PDF文件验证失败: {file_path}")
-        
         try:
             extracted_text = []
-            
-            with pdfplumber.open(file_path) as pdf:
-                total_pages = len(pdf.pages)
-                
+
+            with self._open_validated(file_path) as pdf:
+                total_pages = self._fast_page_count(pdf)
+
                 for page_num, page in enumerate(pdf.pages, 1):
                     try:
                         page_text = page.extract_text()
@@ -324,9 +1067,11 @@ class PDFProcessor(PDFProcessorInterface):
             
             if not full_text.strip():
                 raise PDFProcessorError("PDF文件中未找到可提取的文本内容")
-            
+
             return full_text
-            
+
+        except PDFProcessorError:
+            raise
         except Exception as e:
             raise PDFProcessorError(f"文本提取失败: {str(e)}")
     
@@ -340,15 +1085,14 @@ class PDFProcessor(PDFProcessorInterface):
             bool: 是否包含可搜索文本
         """
         try:
-            with pdfplumber.open(file_path) as pdf:
-                # 检查前几页
-                pages_to_check = min(3, len(pdf.pages))
-                
-                for i in range(pages_to_check):
-                    page_text = pdf.pages[i].extract_text()
+            with self._open_pdf(file_path) as pdf:
+                # 惰性遍历前几页，首个含文本的页面立即返回，
+                # 后续页面完全不解析
+                for page in itertools.islice(pdf.pages, 3):
+                    page_text = page.extract_text()
                     if page_text and page_text.strip():
                         return True
-                
+
                 return False
                 
         except Exception:
@@ -363,76 +1107,21 @@ class PDFProcessor(PDFProcessorInterface):
         Returns:
             Dict: 健康检查结果
         """
-        health_info = {
-            'is_healthy': True,
-            'issues': [],
-            'warnings': [],
-            'is_readable': True,
-            'is_encrypted': False,
-            'has_corrupted_pages': False,
-            'total_pages': 0,
-            'readable_pages': 0
-        }
-        
+        health_info = self._empty_health_report()
+
         try:
-            # 基本验证
-            if not self.validate_pdf(file_path):
-                health_info['is_healthy'] = False
-                health_info['is_readable'] = False
-                health_info['issues'].append("PDF文件验证失败")
-                return health_info
-            
-            with pdfplumber.open(file_path) as pdf:
-                health_info['total_pages'] = len(pdf.pages)
-                
-                # 检查加密状态
-                try:
-                    if hasattr(pdf, 'is_encrypted') and pdf.is_encrypted:
-                        health_info['is_encrypted'] = True
-                        health_info['warnings'].append("PDF文件已加密")
-                except:
-                    pass
-                
-                # 检查每一页的可读性
-                corrupted_pages = []
-                readable_pages = 0
-                
-                for i, page in enumerate(pdf.pages):
-                    try:
-                        # 尝试提取文本
-                        text = page.extract_text()
-                        if text is not None:
-                            readable_pages += 1
-                        
-                        # 尝试获取页面尺寸
-                        _ = page.width, page.height
-                        
-                    except Exception as e:
-                        corrupted_pages.append(i + 1)
-                        health_info['issues'].append(f"第{i + 1}页损坏: {str(e)}")
-                
-                health_info['readable_pages'] = readable_pages
-                
-                if corrupted_pages:
-                    health_info['has_corrupted_pages'] = True
-                    health_info['warnings'].append(f"发现{len(corrupted_pages)}个损坏页面: {corrupted_pages}")
-                
-                # 检查是否有可提取的内容
-                if readable_pages == 0:
-                    health_info['is_readable'] = False
-                    health_info['issues'].append("无法从任何页面提取内容")
-                elif readable_pages < len(pdf.pages) * 0.5:
-                    health_info['warnings'].append("超过50%的页面无法正常读取")
-                
-                # 总体健康评估
-                if len(health_info['issues']) > 0:
-                    health_info['is_healthy'] = False
-                
+            return self.inspect_pdf(file_path, want=('health',))['health']
+
+        except PDFProcessorError:
+            health_info['is_healthy'] = False
+            health_info['is_readable'] = False
+            health_info['issues'].append("PDF文件验证失败")
+
         except Exception as e:
             health_info['is_healthy'] = False
             health_info['is_readable'] = False
             health_info['issues'].append(f"PDF健康检查失败: {str(e)}")
-        
+
         return health_info
     
     def get_content_preview(self, file_path: str, max_chars: int = 500) -> str:
@@ -446,15 +1135,13 @@ class PDFProcessor(PDFProcessorInterface):
             str: 内容预览
         """
         try:
-            if not self.validate_pdf(file_path):
-                return "无法读取PDF文件"
-            
-            with pdfplumber.open(file_path) as pdf:
+            with self._open_validated(file_path) as pdf:
                 preview_text = []
                 current_chars = 0
                 
-                # 从前几页提取预览文本
-                for i, page in enumerate(pdf.pages[:3]):
+                # 惰性遍历前几页提取预览文本（islice不物化页面切片，
+                # 字符数达到上限break后剩余页面不再解析）
+                for i, page in enumerate(itertools.islice(pdf.pages, 3)):
                     try:
                         page_text = page.extract_text()
                         if page_text and page_text.strip():
@@ -481,7 +1168,9 @@ class PDFProcessor(PDFProcessorInterface):
                     return "PDF文件不包含可提取的文本内容"
                 
                 return "\n\n".join(preview_text)
-                
+
+        except PDFProcessorError:
+            return "无法读取PDF文件"
         except Exception as e:
             return f"获取预览失败: {str(e)}"
     
@@ -494,92 +1183,12 @@ class PDFProcessor(PDFProcessorInterface):
         Returns:
             Dict: 结构分析结果
         """
-        structure_info = {
-            'total_pages': 0,
-            'has_text': False,
-            'has_images': False,
-            'has_tables': False,
-            'text_density': 0.0,  # 文本密度（字符数/页面数）
-            'avg_words_per_page': 0,
-            'page_sizes': [],
-            'content_distribution': {
-                'text_pages': 0,
-                'image_pages': 0,
-                'mixed_pages': 0,
-                'empty_pages': 0
-            }
-        }
-        
         try:
-            if not self.validate_pdf(file_path):
-                return structure_info
-            
-            with pdfplumber.open(file_path) as pdf:
-                structure_info['total_pages'] = len(pdf.pages)
-                total_text_chars = 0
-                total_words = 0
-                
-                for i, page in enumerate(pdf.pages):
-                    try:
-                        # 页面尺寸
-                        if hasattr(page, 'width') and hasattr(page, 'height'):
-                            structure_info['page_sizes'].append({
-                                'page': i + 1,
-                                'width': page.width,
-                                'height': page.height
-                            })
-                        
-                        # 文本分析
-                        page_text = page.extract_text()
-                        has_page_text = bool(page_text and page_text.strip())
-                        
-                        # 图片分析
-                        has_page_images = bool(hasattr(page, 'images') and page.images)
-                        
-                        # 表格分析（简单检测）
-                        has_page_tables = False
-                        if hasattr(page, 'extract_tables'):
-                            try:
-                                tables = page.extract_tables()
-                                has_page_tables = bool(tables)
-                                if has_page_tables:
-                                    structure_info['has_tables'] = True
-                            except:
-                                pass
-                        
-                        # 更新全局标记
-                        if has_page_text:
-                            structure_info['has_text'] = True
-                            total_text_chars += len(page_text.strip())
-                            # 简单单词计数
-                            import re
-                            words = re.findall(r'\b\w+\b', page_text)
-                            total_words += len(words)
-                        
-                        if has_page_images:
-                            structure_info['has_images'] = True
-                        
-                        # 页面内容分类
-                        if has_page_text and has_page_images:
-                            structure_info['content_distribution']['mixed_pages'] += 1
-                        elif has_page_text:
-                            structure_info['content_distribution']['text_pages'] += 1
-                        elif has_page_images:
-                            structure_info['content_distribution']['image_pages'] += 1
-                        else:
-                            structure_info['content_distribution']['empty_pages'] += 1
-                            
-                    except Exception as e:
-                        self.logger.warning(f"分析第{i+1}页结构时出错: {str(e)}")
-                        structure_info['content_distribution']['empty_pages'] += 1
-                        continue
-                
-                # 计算统计信息
-                if structure_info['total_pages'] > 0:
-                    structure_info['text_density'] = total_text_chars / structure_info['total_pages']
-                    structure_info['avg_words_per_page'] = total_words / structure_info['total_pages']
-                
+            return self.inspect_pdf(file_path, want=('structure',))['structure']
+
+        except PDFProcessorError:
+            return self._empty_structure_report()
+
         except Exception as e:
             self.logger.error(f"PDF结构分析失败: {str(e)}")
-        
-        return structure_info
\ No newline at end of file
+            return self._empty_structure_report()
\ No newline at end of file
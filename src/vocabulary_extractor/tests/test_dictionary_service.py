@@ -17,6 +17,7 @@ from vocabulary_extractor.dictionary import (
     LocalDictionaryService,
     DictionaryCache,
     MemoryCache,
+    PersistentCache,
     ServicePriority,
     ServiceStatus,
     DictionaryServiceError
@@ -83,6 +84,150 @@ class TestMemoryCache(unittest.TestCase):
         stats = self.cache.stats()
         self.assertEqual(stats['expired_entries'], 1)
 
+    def test_sharded_capacity_bound(self):
+        """测试多分片配置下总条目数不超过max_size"""
+        cache = MemoryCache(max_size=128, default_ttl=None)
+        for i in range(300):
+            cache.set(f"key{i}", i)
+
+        stats = cache.stats()
+        self.assertLessEqual(stats['total_entries'], 128)
+        self.assertGreater(stats['total_entries'], 0)
+
+    def test_get_many_mixed(self):
+        """测试批量获取：命中/过期/未命中混合"""
+        self.cache.set("hit", "value1")
+        self.cache.set("expired", "value2", ttl=0.1)
+
+        time.sleep(0.2)  # 等待expired过期
+        results = self.cache.get_many(["hit", "expired", "missing"])
+
+        self.assertEqual(results, {"hit": "value1"})
+        # 过期条目应在批量探测中被顺带清除
+        self.assertIsNone(self.cache.get("expired"))
+
+    def test_get_many_updates_recency(self):
+        """测试批量命中与get一样刷新LRU位置"""
+        self.cache.set("key1", "value1")
+        self.cache.set("key2", "value2")
+        self.cache.set("key3", "value3")
+
+        # 批量访问key1使其成为最近使用
+        self.cache.get_many(["key1"])
+
+        # 添加新键，应该淘汰key2
+        self.cache.set("key4", "value4")
+
+        self.assertEqual(self.cache.get("key1"), "value1")
+        self.assertIsNone(self.cache.get("key2"))
+
+    def test_set_fresh_backfill(self):
+        """测试持久层命中后的快速回填路径"""
+        self.cache.set_fresh("key1", "value1")
+        self.assertEqual(self.cache.get("key1"), "value1")
+
+    def test_set_fresh_uses_default_ttl(self):
+        """测试回填条目同样按默认TTL过期"""
+        cache = MemoryCache(max_size=3, default_ttl=0.1)
+        cache.set_fresh("key1", "value1")
+
+        time.sleep(0.2)  # 等待过期
+        self.assertIsNone(cache.get("key1"))
+
+    def test_set_fresh_evicts_when_full(self):
+        """测试回填在缓存满时同样触发淘汰"""
+        self.cache.set("key1", "value1")
+        self.cache.set("key2", "value2")
+        self.cache.set("key3", "value3")
+
+        self.cache.set_fresh("key4", "value4")
+
+        self.assertEqual(self.cache.get("key4"), "value4")
+        self.assertLessEqual(self.cache.stats()['total_entries'], 3)
+
+
+class TestPersistentCache(unittest.TestCase):
+    """测试持久化缓存功能"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.cache = PersistentCache(cache_dir=self.temp_dir)
+
+    def tearDown(self):
+        self.cache.flush()
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_set_get_before_flush(self):
+        """测试写入后立即可读（落盘前从写覆盖层返回）"""
+        self.cache.set("word:test", {"definition": "测试"})
+        self.assertEqual(self.cache.get("word:test"), {"definition": "测试"})
+
+    def test_get_missing_key(self):
+        """测试不存在的键（已知键集合快路径）"""
+        self.assertIsNone(self.cache.get("word:nonexistent"))
+
+    def test_delete(self):
+        """测试删除条目"""
+        self.cache.set("word:test", "value")
+        self.assertTrue(self.cache.delete("word:test"))
+        self.assertIsNone(self.cache.get("word:test"))
+        self.assertFalse(self.cache.delete("word:test"))
+
+    def test_flush_and_reopen(self):
+        """测试flush后新实例能从磁盘读回条目"""
+        self.cache.set("word:persist", ("释义", "/test/"))
+        self.cache.flush()
+
+        reopened = PersistentCache(cache_dir=self.temp_dir)
+        self.assertEqual(reopened.get("word:persist"), ("释义", "/test/"))
+
+    def test_delete_persists_after_flush(self):
+        """测试墓碑删除落盘后重开数据库仍不可见"""
+        self.cache.set("word:test", "value")
+        self.cache.flush()
+        self.cache.delete("word:test")
+        self.cache.flush()
+
+        reopened = PersistentCache(cache_dir=self.temp_dir)
+        self.assertIsNone(reopened.get("word:test"))
+
+    def test_ttl_expiration(self):
+        """测试TTL过期"""
+        self.cache.set("word:short", "value", ttl=0.1)
+        self.assertEqual(self.cache.get("word:short"), "value")
+        self.cache.flush()
+
+        time.sleep(0.2)  # 等待过期
+        self.assertIsNone(self.cache.get("word:short"))
+
+    def test_cleanup_expired(self):
+        """测试清理过期条目"""
+        self.cache.set("word:keep", "value")
+        self.cache.set("word:expired", "value", ttl=0.1)
+
+        time.sleep(0.2)  # 等待过期
+        cleaned = self.cache.cleanup_expired()
+
+        self.assertEqual(cleaned, 1)
+        self.assertEqual(self.cache.get("word:keep"), "value")
+        self.assertIsNone(self.cache.get("word:expired"))
+        self.assertEqual(len(self.cache), 1)
+
+    def test_len_counts_pending_entries(self):
+        """测试条目计数覆盖尚未落盘的写入"""
+        self.assertEqual(len(self.cache), 0)
+        self.cache.set("word:a", 1)
+        self.cache.set("word:b", 2)
+        self.assertEqual(len(self.cache), 2)
+
+    def test_clear(self):
+        """测试清空缓存"""
+        self.cache.set("word:a", 1)
+        self.cache.clear()
+
+        self.assertIsNone(self.cache.get("word:a"))
+        self.assertEqual(len(self.cache), 0)
+
 
 class TestDictionaryCache(unittest.TestCase):
     """测试词典缓存功能"""
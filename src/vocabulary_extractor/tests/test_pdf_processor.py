@@ -251,6 +251,127 @@ class TestPDFProcessor(unittest.TestCase):
         result = self.processor.is_text_searchable(pdf_file)
         self.assertFalse(result)
 
+    def _create_sample_pdf(self, name="sample.pdf", pages=3):
+        """用reportlab生成真实的小型PDF测试文件
+
+        批量/后端相关的API在子进程中重新打开文件，
+        无法用模拟的pdfplumber覆盖，需要真实文件。
+        """
+        from reportlab.lib.pagesizes import A4
+        from reportlab.pdfgen import canvas
+
+        pdf_file = os.path.join(self.temp_dir, name)
+        c = canvas.Canvas(pdf_file, pagesize=A4)
+        for i in range(pages):
+            c.drawString(72, 720, f"Page {i + 1} sample vocabulary content")
+            c.showPage()
+        c.save()
+        return pdf_file
+
+    def _real_processor(self, **kwargs):
+        """创建缓存目录指向临时目录的处理器，避免污染用户缓存"""
+        kwargs.setdefault('max_file_size_mb', 10)
+        kwargs.setdefault('cache_dir', os.path.join(self.temp_dir, 'cache'))
+        return PDFProcessor(**kwargs)
+
+    def test_invalid_extraction_backend(self):
+        """测试未知提取后端应拒绝"""
+        with self.assertRaises(ValueError):
+            PDFProcessor(extraction_backend='gpu')
+
+    def test_extraction_backends_identical_output(self):
+        """测试三种提取后端对同一文件输出相同文本"""
+        pdf_file = self._create_sample_pdf()
+
+        texts = {}
+        for backend in ('sequential', 'threads', 'processes'):
+            processor = self._real_processor(extraction_backend=backend)
+            texts[backend] = processor.extract_text(pdf_file,
+                                                    force_refresh=True)
+
+        self.assertEqual(texts['sequential'], texts['threads'])
+        self.assertEqual(texts['sequential'], texts['processes'])
+        self.assertIn("Page 1", texts['sequential'])
+        self.assertIn("Page 3", texts['sequential'])
+
+    def test_extract_texts_reports_per_file_errors(self):
+        """测试批量提取：单个文件失败只记入错误字典"""
+        good_file = self._create_sample_pdf("good.pdf")
+        missing_file = os.path.join(self.temp_dir, "missing.pdf")
+
+        processor = self._real_processor()
+        texts, errors = processor.extract_texts([good_file, missing_file])
+
+        self.assertIn(good_file, texts)
+        self.assertIn("Page 1", texts[good_file])
+        self.assertIn(missing_file, errors)
+        self.assertNotIn(missing_file, texts)
+
+    def test_extract_texts_bounded_reports_per_file_errors(self):
+        """测试有界批量提取与extract_texts行为一致"""
+        good_file = self._create_sample_pdf("good.pdf")
+        missing_file = os.path.join(self.temp_dir, "missing.pdf")
+
+        processor = self._real_processor()
+        texts, errors = processor.extract_texts_bounded(
+            [good_file, missing_file], max_inflight=1)
+
+        self.assertIn(good_file, texts)
+        self.assertIn("Page 1", texts[good_file])
+        self.assertIn(missing_file, errors)
+        self.assertNotIn(missing_file, texts)
+
+    def test_inspect_pdf_matches_legacy_shapes(self):
+        """测试融合检查与原有各API的返回结构一致"""
+        pdf_file = self._create_sample_pdf()
+        processor = self._real_processor()
+
+        views = processor.inspect_pdf(pdf_file)
+        self.assertEqual(set(views), {'info', 'health', 'structure'})
+
+        self.assertEqual(views['health'], processor.check_pdf_health(pdf_file))
+        self.assertEqual(views['structure'],
+                         processor.analyze_pdf_structure(pdf_file))
+        self.assertEqual(set(views['info']),
+                         set(processor.get_pdf_info(pdf_file)))
+
+        self.assertTrue(views['health']['is_healthy'])
+        self.assertEqual(views['structure']['total_pages'], 3)
+
+    def test_get_pdf_metadata_only(self):
+        """测试元数据快速路径返回基础字段"""
+        pdf_file = self._create_sample_pdf()
+        processor = self._real_processor()
+
+        meta = processor.get_pdf_metadata_only(pdf_file)
+
+        self.assertEqual(meta['file_name'], 'sample.pdf')
+        self.assertEqual(meta['total_pages'], 3)
+        self.assertFalse(meta['is_encrypted'])
+
+    def test_extract_text_to_file(self):
+        """测试流式提取到磁盘文件"""
+        pdf_file = self._create_sample_pdf()
+        out_path = os.path.join(self.temp_dir, "out.txt")
+        processor = self._real_processor()
+
+        written = processor.extract_text_to_file(pdf_file, out_path)
+
+        self.assertGreater(written, 0)
+        content = Path(out_path).read_text(encoding='utf-8')
+        self.assertIn("Page 2", content)
+
+    def test_iter_pages_text(self):
+        """测试逐页文本迭代器"""
+        pdf_file = self._create_sample_pdf()
+        processor = self._real_processor()
+
+        pages = list(processor.iter_pages_text(pdf_file))
+
+        self.assertEqual(len(pages), 3)
+        for i, page_text in enumerate(pages):
+            self.assertIn(f"Page {i + 1}", page_text)
+
 
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file